@@ -0,0 +1,54 @@
+"""Benchmark the vectorized ``align_curves`` against the original loops.
+
+Run from the repository root with ``python -m benchmarks.bench_align_curves``.
+"""
+
+import argparse
+import timeit
+import warnings
+
+import pandas as pd
+
+from benchmarks.synthetic import jhu_wide_frame
+from covid19_eda.processing import align_curves, group_by_country
+
+
+# Original per-column implementation, kept as the reference
+def align_curves_loop(data, min_val):
+
+    # Loop over columns & set values < min_val to None
+    for col in data.columns:
+        data.loc[(data[col] < min_val), col] = None
+    # Drop columns with all NaNs
+    data.dropna(axis=1, how="all", inplace=True)
+    # Reset index, drop date
+    data = data.reset_index().drop(['index'], axis=1)
+    # Shift each column to begin with first valid index
+    for col in data.columns:
+        data[col] = data[col].shift(-data[col].first_valid_index())
+    return data
+
+
+def run(n_days, n_cols, min_val, repeat):
+    data = group_by_country(jhu_wide_frame(n_countries=n_cols, n_provinces=1, n_days=n_days))
+    pd.testing.assert_frame_equal(align_curves(data, min_val), align_curves_loop(data.copy(), min_val))
+    loop = min(timeit.repeat(lambda: align_curves_loop(data.copy(), min_val), number=1, repeat=repeat))
+    vectorized = min(timeit.repeat(lambda: align_curves(data, min_val), number=1, repeat=repeat))
+    print('%5d columns x %d days: loop %.4fs, vectorized %.4fs (%.1fx)'
+          % (n_cols, n_days, loop, vectorized, loop / vectorized))
+
+
+def main():
+    # The reference loop triggers fragmentation warnings on wide frames
+    warnings.simplefilter('ignore', pd.errors.PerformanceWarning)
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--days', type=int, default=800)
+    parser.add_argument('--min-val', type=int, default=25)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    for n_cols in (200, 5000):
+        run(args.days, n_cols, args.min_val, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
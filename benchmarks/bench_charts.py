@@ -0,0 +1,37 @@
+"""Spec size and build time of the aligned chart for several point budgets.
+
+Run from the repository root with ``python -m benchmarks.bench_charts``.
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import jhu_wide_frame
+from covid19_eda.charts import aligned_chart
+from covid19_eda.longform import long_frame
+from covid19_eda.processing import align_curves, group_by_country
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--countries', type=int, default=2000)
+    parser.add_argument('--days', type=int, default=800)
+    parser.add_argument('--budgets', type=int, nargs='+', default=[0, 200000, 50000, 10000])
+    args = parser.parse_args()
+
+    import altair as alt
+    alt.data_transformers.disable_max_rows()
+
+    raw = jhu_wide_frame(n_countries=args.countries, n_provinces=1, n_days=args.days)
+    deaths_long = long_frame(align_curves(group_by_country(raw), 25), 'Deaths')
+    print('%d countries, %d points' % (args.countries, len(deaths_long)))
+    for budget in args.budgets:
+        start = time.perf_counter()
+        spec = aligned_chart(deaths_long, max_points=budget or None).to_json()
+        elapsed = time.perf_counter() - start
+        print('budget %-8s spec %8.1f MiB  build %6.2fs'
+              % (budget or 'all', len(spec) / 2**20, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Compare loading grouped frames from CSV against the binary snapshot.
+
+Run from the repository root with ``python -m benchmarks.bench_snapshot``.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks.synthetic import write_jhu_csv
+from covid19_eda.processing import group_by_country
+from covid19_eda.snapshot import load_snapshot, save_snapshot, source_hash
+
+METRICS = ('confirmed', 'deaths', 'recovered')
+
+
+def measure(label, func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print('%-10s %8.3fs  peak %8.1f MiB' % (label, elapsed, peak / 2**20))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--countries', type=int, default=200)
+    parser.add_argument('--provinces', type=int, default=3)
+    parser.add_argument('--days', type=int, default=800)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [write_jhu_csv(os.path.join(tmp, name + '.csv'), n_countries=args.countries,
+                               n_provinces=args.provinces, n_days=args.days, seed=seed)
+                 for seed, name in enumerate(METRICS)]
+        source = source_hash(paths)
+
+        def from_csv():
+            return {name: group_by_country(pd.read_csv(path)) for name, path in zip(METRICS, paths)}
+
+        frames = measure('csv', from_csv)
+        snapshot_dir = os.path.join(tmp, 'snapshot')
+        save_snapshot(frames, snapshot_dir, source)
+        loaded = measure('snapshot', lambda: load_snapshot(snapshot_dir, source))
+        for name in METRICS:
+            pd.testing.assert_frame_equal(loaded[name], frames[name], check_freq=False)
+        print('snapshot size %.1f MiB' % (sum(
+            os.path.getsize(os.path.join(snapshot_dir, f)) for f in os.listdir(snapshot_dir)) / 2**20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+"""Benchmark every stage of the EDA pipeline on synthetic JHU-shaped data.
+
+Run from the repository root::
+
+    python -m benchmarks.suite run --countries 200 --provinces 3 --days 800 -o results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.1
+
+``run`` writes a wide CSV with the requested shape, times each stage in
+isolation (inputs are prepared outside the measured region) and records wall
+time, peak traced memory and the number of memory blocks the stage left
+allocated.  ``compare`` flags stages whose time or peak memory grew by more
+than the threshold and exits non-zero if any did.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import write_jhu_csv
+from covid19_eda.loader import read_jhu_csv
+from covid19_eda.longform import long_frame
+from covid19_eda.processing import align_curves, group_by_country
+
+
+# The notebook's original melt, kept for comparison with long_frame
+def _melt_reference(aligned):
+    return aligned.reset_index().melt(id_vars='index', value_name='Deaths').rename(
+        columns={'index': 'Day'}).dropna()
+
+
+def _plot(ctx):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from covid19_eda.plotting import plot_time_series
+    columns = list(ctx['grouped'].columns[:ctx['plot_columns']])
+    ax = plot_time_series(ctx['grouped'][columns], 'Benchmark', 'Date', 'Count', logy=True)
+    ax.figure.savefig(os.path.join(ctx['tmp'], 'plot.png'))
+    plt.close(ax.figure)
+
+
+def _render(ctx):
+    from covid19_eda.render import render_figure
+    columns = list(ctx['grouped'].columns[:ctx['plot_columns']])
+    render_figure(ctx['grouped'][columns], os.path.join(ctx['tmp'], 'render.png'),
+                  'Benchmark', 'Date', 'Count', logy=True)
+
+
+def _altair(ctx):
+    from covid19_eda.charts import aligned_chart
+    aligned_chart(ctx['long'], max_points=ctx['chart_points']).to_dict()
+
+
+# Stage name -> function of the shared context; run in this order
+STAGES = [
+    ('read_csv', lambda ctx: pd.read_csv(ctx['path'])),
+    ('read_jhu_csv', lambda ctx: read_jhu_csv(ctx['path'])),
+    ('group_by_country', lambda ctx: group_by_country(ctx['raw'])),
+    ('align_curves', lambda ctx: align_curves(ctx['grouped'], ctx['min_val'])),
+    ('melt', lambda ctx: long_frame(ctx['aligned'], 'Deaths')),
+    ('melt_reference', lambda ctx: _melt_reference(ctx['aligned'])),
+    ('plot_time_series', _plot),
+    ('render_figure', _render),
+    ('altair_spec', _altair),
+]
+
+
+def measure(func, ctx, repeat):
+    """Best-of-``repeat`` wall time, then one traced run for memory."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(ctx)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = func(ctx)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return {'wall_s': min(times), 'peak_bytes': peak, 'allocated_blocks': blocks}
+
+
+def run(args):
+    import altair as alt
+    alt.data_transformers.disable_max_rows()
+
+    results = {
+        'config': {key: getattr(args, key) for key in
+                   ('countries', 'provinces', 'days', 'min_val', 'repeat', 'seed')},
+        'environment': {'python': platform.python_version(), 'numpy': np.__version__,
+                        'pandas': pd.__version__, 'platform': platform.platform()},
+        'stages': {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_jhu_csv(os.path.join(tmp, 'deaths.csv'), n_countries=args.countries,
+                             n_provinces=args.provinces, n_days=args.days, seed=args.seed)
+        ctx = {'path': path, 'tmp': tmp, 'min_val': args.min_val,
+               'plot_columns': 7, 'chart_points': args.chart_points}
+        ctx['raw'] = pd.read_csv(path)
+        ctx['grouped'] = group_by_country(ctx['raw'])
+        ctx['aligned'] = align_curves(ctx['grouped'], args.min_val)
+        ctx['long'] = long_frame(ctx['aligned'], 'Deaths')
+
+        for name, func in STAGES:
+            if args.stages and name not in args.stages:
+                continue
+            results['stages'][name] = stats = measure(func, ctx, args.repeat)
+            print('%-18s %9.4fs  peak %9.1f MiB  blocks %+d'
+                  % (name, stats['wall_s'], stats['peak_bytes'] / 2**20, stats['allocated_blocks']))
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    return 0
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)['stages']
+    with open(args.current) as f:
+        current = json.load(f)['stages']
+
+    regressions = 0
+    for name in current:
+        if name not in baseline:
+            continue
+        for key in ('wall_s', 'peak_bytes'):
+            old, new = baseline[name][key], current[name][key]
+            change = (new - old) / old if old else 0.0
+            flag = change > args.threshold
+            regressions += flag
+            print('%-18s %-10s %12.4g -> %12.4g  %+7.1f%%%s'
+                  % (name, key, old, new, 100 * change, '  REGRESSION' if flag else ''))
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='benchmark all stages')
+    run_parser.add_argument('--countries', type=int, default=200)
+    run_parser.add_argument('--provinces', type=int, default=3)
+    run_parser.add_argument('--days', type=int, default=800)
+    run_parser.add_argument('--min-val', type=int, default=25)
+    run_parser.add_argument('--chart-points', type=int, default=None)
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--stages', nargs='*', choices=[name for name, _ in STAGES])
+    run_parser.add_argument('-o', '--output', default='bench_results.json')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='flag regressions between two runs')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1)
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""Synthetic inputs shaped like the JHU global time-series CSVs."""
+
+import numpy as np
+import pandas as pd
+
+
+def jhu_wide_frame(n_countries=200, n_provinces=3, n_days=800, seed=0):
+    """Raw wide frame: Province/State, Country/Region, Lat, Long, then dates.
+
+    Every country gets ``n_provinces`` rows (the first one without a
+    province name) holding cumulative counts with staggered outbreaks.
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = n_countries * n_provinces
+    country = np.repeat(['Country %d' % i for i in range(n_countries)], n_provinces)
+    province = np.array([None if i % n_provinces == 0 else 'Province %d' % i
+                         for i in range(n_rows)], dtype=object)
+
+    daily = rng.poisson(rng.gamma(0.5, 4.0, size=n_rows), size=(n_days, n_rows))
+    start = rng.integers(0, n_days, size=n_rows)
+    daily[np.arange(n_days)[:, None] < start[None, :]] = 0
+    dates = pd.date_range('2020-01-22', periods=n_days, freq='D')
+    # JHU headers look like 1/22/20
+    date_columns = ['%d/%d/%s' % (d.month, d.day, d.strftime('%y')) for d in dates]
+
+    frame = pd.DataFrame(daily.cumsum(axis=0).T, columns=date_columns)
+    frame.insert(0, 'Long', rng.uniform(-180, 180, size=n_rows))
+    frame.insert(0, 'Lat', rng.uniform(-90, 90, size=n_rows))
+    frame.insert(0, 'Country/Region', country)
+    frame.insert(0, 'Province/State', province)
+    return frame
+
+
+def write_jhu_csv(path, **kwargs):
+    """Write a :func:`jhu_wide_frame` to ``path`` and return the path."""
+    jhu_wide_frame(**kwargs).to_csv(path, index=False)
+    return path
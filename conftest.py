@@ -0,0 +1,46 @@
+# Puts the repository root on sys.path so tests can import covid19_eda.
+import http.server
+import threading
+
+import pytest
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    # The server's ``respond(handler)`` returns ``(status, headers, body)``
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        status, headers, body = self.server.respond(self)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Start a local HTTP server answering every GET with ``respond(handler)``.
+
+    The returned server has ``url`` (with a trailing slash) and records
+    ``requests`` as ``(path, headers)`` pairs.
+    """
+    servers = []
+
+    def start(respond):
+        httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        httpd.respond = respond
+        httpd.requests = []
+        httpd.url = 'http://127.0.0.1:%d/' % httpd.server_port
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append(httpd)
+        return httpd
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+        httpd.server_close()
@@ -0,0 +1,45 @@
+"""Reusable data-processing helpers for the COVID-19 EDA notebook.
+
+Submodules are imported on first attribute access, so ``import covid19_eda``
+does no work and plotting libraries (matplotlib, altair) are only loaded by
+the functions that draw.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'charts': ['aligned_chart', 'downsample_long', 'label_positions', 'lttb'],
+    'chunked': ['group_us_chunked'],
+    'compact': ['compact_counts', 'memory_report', 'smallest_int_dtype'],
+    'cube': ['RollupCube'],
+    'daily_reports': ['ingest_daily_reports', 'load_daily_reports'],
+    'fetch': ['read_csv_cached'],
+    'incremental': ['append_aligned', 'append_new_dates', 'first_crossings', 'refresh'],
+    'loader': ['URLS', 'load_raw', 'read_jhu_csv'],
+    'longform': ['iter_long', 'long_frame', 'write_long'],
+    'metrics': ['compute_metrics', 'get_metric'],
+    'plotting': ['plot_time_series'],
+    'processing': ['align_curves', 'group_by_country'],
+    'profiling': ['instrument', 'stage', 'tracing'],
+    'quality': ['check_quality', 'repair'],
+    'query': ['SeriesQuery'],
+    'render': ['render_batch', 'render_figure'],
+    'report': ['build_report', 'default_charts'],
+    'snapshot': ['load_grouped', 'load_snapshot', 'save_snapshot'],
+    'sweep': ['AlignedSweep', 'align_sweep'],
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    value = getattr(importlib.import_module('covid19_eda.' + _MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
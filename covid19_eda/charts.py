@@ -0,0 +1,128 @@
+"""Interactive Altair chart of aligned curves with server-side aggregation.
+
+The notebook's chart ships every point to the browser and lets Vega-Lite
+compute the label positions (``argmax`` over ``Day``).  Here the labels are
+computed in pandas and each series is downsampled with
+Largest-Triangle-Three-Buckets (LTTB) to fit a total point budget before the
+data is embedded, keeping the same ``base``/``chart``/``overlay``/``text``
+composition.  Altair is only imported when a chart is built.
+"""
+
+import numpy as np
+
+
+def lttb(x, y, n_out):
+    """Indices of the ``n_out`` points LTTB keeps from the series ``(x, y)``."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    every = (n - 2) / (n_out - 2)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        # Average of the next bucket (the last point for the final bucket)
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        # Keep the point forming the largest triangle with a and the average
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+
+def downsample_long(long_df, max_points, x='Day', y='Deaths', group='Country/Region', logy=False):
+    """LTTB-downsample every series of a long frame to a total point budget.
+
+    With ``logy`` the triangles are measured on log10 values, matching a
+    chart with a log y-axis.  Every kept series needs at least 3 points, so
+    when the budget cannot cover all of them only the ``max_points // 3``
+    series with the largest values are kept.
+    """
+    if max_points < 3:
+        raise ValueError('max_points must be at least 3, got %r' % (max_points,))
+    n_series = long_df[group].nunique()
+    if not n_series or len(long_df) <= max_points:
+        return long_df
+    groups = long_df.groupby(group, sort=False)
+    indices = groups.indices
+    names = list(indices)
+    if n_series > max_points // 3:
+        largest = set(groups[y].max().nlargest(max_points // 3).index)
+        names = [name for name in names if name in largest]
+    series_list = [indices[name] for name in names]
+    per_series = max_points // len(series_list)
+    keep = []
+    for series in series_list:
+        values = long_df[y].to_numpy()[series]
+        keep.append(series[lttb(long_df[x].to_numpy()[series],
+                                np.log10(values) if logy else values, per_series)])
+    return long_df.iloc[np.sort(np.concatenate(keep))]
+
+
+def label_positions(long_df, x='Day', y='Deaths', group='Country/Region'):
+    """Last point of every series, where the chart draws its text label."""
+    return long_df.loc[long_df.groupby(group, sort=False)[x].idxmax()]
+
+
+def aligned_chart(long_df, value='Deaths', x='Day', country='Country/Region',
+                  max_points=None, logy=True, width=800, height=650):
+    """Clickable aligned-curves chart with on-chart labels.
+
+    ``long_df`` is the long-format data (see ``covid19_eda.longform``);
+    ``max_points`` caps the number of line points embedded in the spec.
+    """
+    import altair as alt
+
+    if max_points:
+        long_df = downsample_long(long_df, max_points, x, value, country, logy)
+    labels = label_positions(long_df, x, value, country)
+    scale = alt.Scale(type='log' if logy else 'linear')
+
+    # Selection tool
+    selection = alt.selection_point(fields=[country])
+
+    # Base altair plot
+    base = alt.Chart(long_df).mark_line(strokeWidth=4, opacity=0.7).encode(
+        x=alt.X(x),
+        y=alt.Y(value, scale=scale),
+        color=alt.Color(country, legend=None),
+    ).properties(
+        width=width,
+        height=height
+    )
+
+    # Chart
+    chart = base.encode(
+        color=alt.condition(selection, country + ':N', alt.value('lightgray'))
+    ).add_params(
+        selection
+    )
+
+    # Overlay
+    overlay = base.encode(
+        color=country,
+        opacity=alt.value(0.5),
+        tooltip=[country + ':N', x, value]
+    ).transform_filter(
+        selection
+    )
+
+    # Text labels, positioned in pandas rather than with an argmax aggregate
+    text = alt.Chart(labels).mark_text(
+        align='left',
+        dx=5,
+        size=10
+    ).encode(
+        x=alt.X(x, axis=alt.Axis(title=x)),
+        y=alt.Y(value, scale=scale, axis=alt.Axis(title='Reported ' + value)),
+        text=country,
+    ).transform_filter(
+        selection
+    )
+
+    return chart + overlay + text
@@ -0,0 +1,67 @@
+"""Out-of-core grouping of the US county-level time series.
+
+``time_series_covid19_*_US.csv`` has thousands of county rows, more than a
+thousand date columns and extra metadata (``UID``, ``FIPS``, ``Admin2``,
+``Combined_Key``, ``Population``...), so grouping and transposing it in
+memory is expensive.  Here the key column is read first to fix the group
+codes, then the dates are parsed once, ``chunk_rows`` rows at a time; each
+chunk is summed by group with one ``np.add.reduceat`` over its rows sorted
+by code and added straight into the matching columns of a memory-mapped
+``.npy`` output.  Peak memory is bounded by ``chunk_rows x dates``.  The
+output directory uses the snapshot layout, so ``load_snapshot`` reads it;
+each metric records the hash of its own source file.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.profiling import instrument
+from covid19_eda.snapshot import load_snapshot, metric_index, read_index, source_hash, write_index
+
+US_ID_COLUMNS = ('UID', 'iso2', 'iso3', 'code3', 'FIPS', 'Admin2', 'Province_State',
+                 'Country_Region', 'Lat', 'Long_', 'Combined_Key', 'Population')
+
+
+@instrument('group_us_chunked')
+def group_us_chunked(path, directory, name, key='Province_State', chunk_rows=1024,
+                     dtype='int64'):
+    """Group a US wide CSV by ``key`` into ``directory/<name>.npy``.
+
+    Returns the date x group frame, memory-mapped from the output.  Rows
+    with no ``key`` value are grouped under ``''``.
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    date_columns = [c for c in header if c not in US_ID_COLUMNS]
+    keys = pd.read_csv(path, usecols=[key], dtype={key: str})[key].fillna('')
+    codes, groups = pd.factorize(keys, sort=True)
+
+    os.makedirs(directory, exist_ok=True)
+    # Written beside the output and renamed over it, like snapshot.save_array
+    target = os.path.join(directory, name + '.npy')
+    out = np.lib.format.open_memmap(target + '.tmp', mode='w+',
+                                    dtype=dtype, shape=(len(date_columns), len(groups)))
+    out[:] = 0
+    chunks = pd.read_csv(path, usecols=date_columns, chunksize=chunk_rows,
+                         dtype=dict.fromkeys(date_columns, dtype))
+    offset = 0
+    for chunk in chunks:
+        chunk_codes = codes[offset:offset + len(chunk)]
+        offset += len(chunk)
+        # Sum the chunk's rows per group and add them into those groups' columns
+        order = np.argsort(chunk_codes, kind='stable')
+        starts = np.flatnonzero(np.r_[True, np.diff(chunk_codes[order]) != 0])
+        values = chunk[date_columns].to_numpy()[order]
+        out[:, chunk_codes[order][starts]] += np.add.reduceat(values, starts, axis=0).T
+    out.flush()
+    del out
+    os.replace(target + '.tmp', target)
+
+    dates = pd.DatetimeIndex(pd.to_datetime(date_columns, format='%m/%d/%y'))
+    columns = pd.Index(groups, name=key)
+    # Keep other metrics already written to the same directory, with their own hashes
+    metrics = dict((read_index(directory) or {}).get('metrics') or {})
+    metrics[name] = dict(metric_index(dates, columns), source_hash=source_hash([path]))
+    write_index(directory, None, metrics)
+    return load_snapshot(directory)[name]
@@ -0,0 +1,59 @@
+"""Memory-compact representations of the count matrices.
+
+Grouped counts are stored in the smallest integer dtype that holds them,
+and aligned curves use pandas nullable integers (values plus a validity
+mask) instead of upcasting everything to float64 to make room for NaN.
+"""
+
+import numpy as np
+import pandas as pd
+
+UNSIGNED = (np.uint8, np.uint16, np.uint32, np.uint64)
+SIGNED = (np.int8, np.int16, np.int32, np.int64)
+
+
+def smallest_int_dtype(values):
+    """Smallest integer dtype holding every non-NaN value of ``values``."""
+    values = np.asarray(values)
+    if values.dtype.kind == 'f':
+        values = values[~np.isnan(values)]
+    if not values.size:
+        return np.dtype(np.uint8)
+    lo, hi = values.min(), values.max()
+    for dtype in (UNSIGNED if lo >= 0 else SIGNED):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def nullable_frame(values, valid, columns, index=None):
+    """Frame of nullable integer columns from a 2-D array and validity mask."""
+    values = np.asfortranarray(values)
+    missing = np.asfortranarray(~valid)
+    data = {i: pd.arrays.IntegerArray(values[:, i], missing[:, i]) for i in range(values.shape[1])}
+    frame = pd.DataFrame(data, index=index)
+    frame.columns = columns
+    return frame
+
+
+def compact_counts(frame):
+    """Downcast a count frame to its smallest integer dtype.
+
+    Frames with missing values get the matching nullable dtype instead.
+    """
+    values = frame.to_numpy(dtype='float64', na_value=np.nan)
+    dtype = smallest_int_dtype(values)
+    valid = ~np.isnan(values)
+    if valid.all():
+        return frame.astype(dtype)
+    return nullable_frame(np.where(valid, values, 0).astype(dtype), valid, frame.columns, frame.index)
+
+
+def memory_report(before, after):
+    """Per-frame memory of two ``{name: frame}`` mappings, in bytes."""
+    rows = {name: (before[name].memory_usage(deep=True).sum(),
+                   after[name].memory_usage(deep=True).sum()) for name in before}
+    report = pd.DataFrame.from_dict(rows, orient='index', columns=['before', 'after'])
+    report['ratio'] = report['after'] / report['before']
+    return report
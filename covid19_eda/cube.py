@@ -0,0 +1,86 @@
+"""Hierarchical province / country / region aggregation cube.
+
+``group_by_country`` throws the ``Province/State`` dimension away, so every
+province view or custom region means regrouping the raw frame.  The cube
+sorts the raw rows once, keeps the province-level matrix, derives the
+country level with a single ``np.add.reduceat`` over the sorted rows and
+the region levels with one membership-matrix product.  Queries then only
+slice the precomputed date x group arrays.
+"""
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.loader import ID_COLUMNS
+
+
+class RollupCube:
+    """Date x group matrices of one metric at every aggregation level.
+
+    Build it with :meth:`from_raw`; levels are ``'province'``,
+    ``'country'`` and any region level added with :meth:`add_regions`.
+    """
+
+    def __init__(self, dates, levels):
+        self.dates = dates
+        self._levels = levels
+
+    @classmethod
+    def from_raw(cls, raw_data, regions=None):
+        """Build the cube from a raw JHU wide frame.
+
+        ``regions`` optionally maps a level name to ``{group: [countries]}``.
+        """
+        raw_data = raw_data.sort_values(['Country/Region', 'Province/State'], na_position='first')
+        date_columns = [c for c in raw_data.columns if c not in ID_COLUMNS]
+        values = raw_data[date_columns].to_numpy().T
+
+        countries = raw_data['Country/Region'].astype(str).to_numpy()
+        provinces = raw_data['Province/State'].astype(object).where(
+            raw_data['Province/State'].notna(), '').astype(str).to_numpy()
+        province_index = pd.MultiIndex.from_arrays(
+            [countries, provinces], names=['Country/Region', 'Province/State'])
+
+        # Rows are sorted by country, so every country is one contiguous run
+        starts = np.flatnonzero(np.r_[True, countries[1:] != countries[:-1]])
+        country_values = np.add.reduceat(values, starts, axis=1) if len(starts) else values[:, :0]
+        country_index = pd.Index(countries[starts], name='Country/Region')
+
+        dates = pd.DatetimeIndex(pd.to_datetime(date_columns, format='%m/%d/%y'))
+        cube = cls(dates, {
+            'province': (province_index, values),
+            'country': (country_index, country_values),
+        })
+        for level, groups in (regions or {}).items():
+            cube.add_regions(level, groups)
+        return cube
+
+    @property
+    def levels(self):
+        return list(self._levels)
+
+    def add_regions(self, level, groups):
+        """Add a level of user-defined ``{group: [countries]}`` regions.
+
+        Groups may overlap; unknown country names are ignored.
+        """
+        country_index, country_values = self._levels['country']
+        membership = np.zeros((len(country_index), len(groups)), dtype=country_values.dtype)
+        for j, members in enumerate(groups.values()):
+            rows = country_index.get_indexer(list(members))
+            membership[rows[rows >= 0], j] = 1
+        self._levels[level] = (pd.Index(list(groups), name=level), country_values @ membership)
+
+    def rollup(self, level, groups=None, start=None, end=None):
+        """Date x group frame at ``level``, optionally for some groups and dates.
+
+        ``start``/``end`` are inclusive date bounds.
+        """
+        index, values = self._levels[level]
+        cols = slice(None) if groups is None else index.get_indexer_for(groups)
+        if groups is not None and (cols < 0).any():
+            missing = [g for g, c in zip(groups, cols) if c < 0]
+            raise KeyError('unknown %s groups: %r' % (level, missing))
+        rows = self.dates.slice_indexer(start, end)
+        return pd.DataFrame(values[rows][:, cols], index=self.dates[rows],
+                            columns=index[cols])
@@ -0,0 +1,181 @@
+"""Async ingestion of the JHU ``csse_covid_19_daily_reports`` files.
+
+Each ``MM-DD-YYYY.csv`` report is fetched over a shared aiohttp session
+(one pooled connector), at most ``concurrency`` at a time, with retries and
+exponential backoff on connection errors, timeouts, 429 and 5xx responses.
+Bodies are parsed while they stream in and summed by country into a shared
+accumulator, which produces the same date x country frames that
+``group_by_country`` returns for the time-series files.  aiohttp is only
+imported when ingestion runs.
+"""
+
+import asyncio
+import codecs
+import csv
+import random
+
+import pandas as pd
+
+from covid19_eda.profiling import instrument
+
+DAILY_REPORTS_URL = ('https://raw.githubusercontent.com/CSSEGISandData/COVID-19/master/'
+                     'csse_covid_19_data/csse_covid_19_daily_reports/')
+METRICS = ('Confirmed', 'Deaths', 'Recovered')
+
+# The report header changed over time (e.g. Country/Region -> Country_Region)
+COUNTRY_COLUMNS = ('Country/Region', 'Country_Region')
+# Early reports used other names for some countries than the time series do
+COUNTRY_ALIASES = {
+    'Mainland China': 'China',
+    'South Korea': 'Korea, South',
+    'Republic of Korea': 'Korea, South',
+    'Iran (Islamic Republic of)': 'Iran',
+    'UK': 'United Kingdom',
+    'Taiwan': 'Taiwan*',
+    'Viet Nam': 'Vietnam',
+    'Russian Federation': 'Russia',
+}
+
+
+class RetryableStatus(Exception):
+    """Server answered with a status worth retrying (429 or 5xx)."""
+
+
+class DailyAccumulator:
+    """Country totals per metric and date, merged one report at a time.
+
+    ``dates`` is the requested range; the frames span all of it even when
+    some reports are missing.
+    """
+
+    def __init__(self, dates=None):
+        self.dates = None if dates is None else pd.DatetimeIndex(dates)
+        self.totals = {metric: {} for metric in METRICS}
+
+    def merge(self, date, report):
+        """Add a ``{metric: {country: total}}`` report for ``date``."""
+        for metric, countries in report.items():
+            day = self.totals[metric].setdefault(date, {})
+            for country, value in countries.items():
+                day[country] = day.get(country, 0) + value
+
+    def to_frames(self):
+        """``{'confirmed': frame, ...}`` shaped like ``group_by_country`` output.
+
+        All frames share the union of countries and the requested dates.
+        Days without a report, and countries absent from a day's report,
+        carry the previous cumulative totals forward; counts are 0 only
+        before a country's first report.
+        """
+        countries = sorted({country for by_date in self.totals.values()
+                            for day in by_date.values() for country in day})
+        dates = self.dates
+        if dates is None:
+            dates = pd.DatetimeIndex(sorted({date for by_date in self.totals.values()
+                                             for date in by_date}))
+        frames = {}
+        for metric, by_date in self.totals.items():
+            frame = pd.DataFrame.from_dict(by_date, orient='index')
+            frame = frame.reindex(index=list(by_date), columns=countries)
+            frame.index = pd.DatetimeIndex(frame.index)
+            frame = frame.reindex(dates).ffill().fillna(0).astype('int64')
+            frame.columns.name = 'Country/Region'
+            frames[metric.lower()] = frame
+        return frames
+
+
+class ReportParser:
+    """Incremental CSV parser summing one daily report by country."""
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+        self._pending = ''
+        self._columns = None
+        self.report = {metric: {} for metric in METRICS}
+
+    def feed(self, data, final=False):
+        text = self._pending + self._decoder.decode(data, final=final)
+        lines = text.split('\n')
+        self._pending = '' if final else lines.pop()
+        for row in csv.reader(line for line in lines if line.strip()):
+            if self._columns is None:
+                self._columns = self._header(row)
+                continue
+            self._add(row)
+
+    def _header(self, row):
+        row = [c.strip() for c in row]
+        country = next(c for c in COUNTRY_COLUMNS if c in row)
+        return row.index(country), {m: row.index(m) for m in METRICS if m in row}
+
+    def _add(self, row):
+        country_at, metric_at = self._columns
+        country = row[country_at].strip()
+        country = COUNTRY_ALIASES.get(country, country)
+        for metric, i in metric_at.items():
+            value = row[i].strip() if i < len(row) else ''
+            if value:
+                totals = self.report[metric]
+                totals[country] = totals.get(country, 0) + int(float(value))
+
+
+async def _fetch_report(session, url, retries, backoff):
+    """Stream and parse one report; None if the file does not exist."""
+    import aiohttp
+
+    for attempt in range(retries + 1):
+        parser = ReportParser()
+        try:
+            async with session.get(url) as response:
+                if response.status == 404:
+                    return None
+                if response.status == 429 or response.status >= 500:
+                    raise RetryableStatus(response.status)
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(1 << 16):
+                    parser.feed(chunk)
+                parser.feed(b'', final=True)
+                return parser.report
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError,
+                asyncio.TimeoutError, RetryableStatus):
+            if attempt == retries:
+                raise
+        # Exponential backoff with jitter before the next attempt
+        await asyncio.sleep(backoff * 2 ** attempt * (1 + random.random()))
+
+
+async def ingest_daily_reports(dates, base_url=DAILY_REPORTS_URL, concurrency=16,
+                               retries=3, backoff=0.5, timeout=60):
+    """Fetch the reports for ``dates`` and sum them by country.
+
+    Returns ``(frames, missing)`` where ``frames`` maps ``confirmed``,
+    ``deaths`` and ``recovered`` to date x country frames and ``missing``
+    lists the dates without a report.
+    """
+    import aiohttp
+
+    dates = pd.DatetimeIndex(dates)
+    accumulator = DailyAccumulator(dates)
+    missing = []
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+        async def one(date):
+            url = base_url + date.strftime('%m-%d-%Y') + '.csv'
+            async with semaphore:
+                report = await _fetch_report(session, url, retries, backoff)
+            if report is None:
+                missing.append(date)
+            else:
+                accumulator.merge(date, report)
+
+        await asyncio.gather(*(one(date) for date in dates))
+    return accumulator.to_frames(), sorted(missing)
+
+
+@instrument('daily_reports')
+def load_daily_reports(start, end, **kwargs):
+    """Synchronous wrapper: ingest every daily report from ``start`` to ``end``."""
+    return asyncio.run(ingest_daily_reports(pd.date_range(start, end, freq='D'), **kwargs))
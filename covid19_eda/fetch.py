@@ -0,0 +1,96 @@
+"""Local on-disk cache for the JHU CSV downloads.
+
+Each URL is stored as a raw file next to a small JSON sidecar holding the
+``ETag`` and ``Last-Modified`` headers of the response.  Later fetches send a
+conditional request and reuse the cached copy on ``304 Not Modified``, or
+whenever the server cannot be reached.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import urllib.error
+import urllib.request
+
+import pandas as pd
+
+from covid19_eda.profiling import instrument
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    'COVID19_EDA_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'covid19_eda'))
+
+
+def cache_paths(url, cache_dir=None):
+    """Return the (data, metadata) file paths used to cache ``url``."""
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    name = os.path.basename(url.split('?')[0]) or 'data'
+    stem = os.path.join(cache_dir, '%s-%s' % (key[:16], name))
+    return stem, stem + '.json'
+
+
+def _read_meta(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path, data, mode='wb'):
+    # Write next to the target and rename, so readers never see partial files
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(fd, mode) as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+@instrument('download')
+def fetch(url, cache_dir=None, timeout=30):
+    """Download ``url`` into the cache, revalidating any existing copy.
+
+    Returns ``(path, status)`` where ``status`` is ``'downloaded'``,
+    ``'not-modified'`` or ``'offline'``.  Raises the underlying error if the
+    server cannot be reached and nothing is cached yet.
+    """
+    data_path, meta_path = cache_paths(url, cache_dir)
+    os.makedirs(os.path.dirname(data_path), exist_ok=True)
+    cached = os.path.exists(data_path)
+    meta = _read_meta(meta_path) if cached else {}
+
+    request = urllib.request.Request(url)
+    if meta.get('etag'):
+        request.add_header('If-None-Match', meta['etag'])
+    if meta.get('last_modified'):
+        request.add_header('If-Modified-Since', meta['last_modified'])
+
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            headers = response.headers
+    except urllib.error.HTTPError as err:
+        if err.code == 304 and cached:
+            return data_path, 'not-modified'
+        if cached and err.code >= 500:
+            return data_path, 'offline'
+        raise
+    except (urllib.error.URLError, OSError):
+        if cached:
+            return data_path, 'offline'
+        raise
+
+    _write_atomic(data_path, body)
+    meta = {'url': url, 'etag': headers.get('ETag'), 'last_modified': headers.get('Last-Modified')}
+    _write_atomic(meta_path, json.dumps(meta), mode='w')
+    return data_path, 'downloaded'
+
+
+def read_csv_cached(url, cache_dir=None, timeout=30, **kwargs):
+    """``pd.read_csv`` on the cached copy of ``url``, fetching it if needed."""
+    path, _ = fetch(url, cache_dir=cache_dir, timeout=timeout)
+    return pd.read_csv(path, **kwargs)
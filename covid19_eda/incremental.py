@@ -0,0 +1,141 @@
+"""Incremental daily refresh of the grouped and aligned time series.
+
+JHU adds one date column per day, so instead of regrouping the whole wide
+CSV we only group and transpose the date columns that are not yet in the
+stored matrices and append them as new rows.  The snapshot records a hash of
+the raw values it was built from; when upstream revised any of those old
+columns the metric is regrouped from scratch instead.  Aligned curves are
+extended the same way: countries that already crossed the threshold keep
+their crossing day and just get the new values appended, and only the
+remaining countries are checked for a crossing in the new rows.
+"""
+
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.compact import smallest_int_dtype
+from covid19_eda.fetch import fetch
+from covid19_eda.loader import ID_COLUMNS, read_jhu_csv
+from covid19_eda.processing import crossing_days, group_by_country
+from covid19_eda.snapshot import load_snapshot, read_index, save_snapshot, source_hash
+
+
+def new_date_columns(header, grouped):
+    """Date columns of a raw ``header`` that are later than ``grouped``'s last row."""
+    dates = [c for c in header if c not in ID_COLUMNS]
+    if not len(grouped):
+        return dates
+    parsed = pd.DatetimeIndex(pd.to_datetime(dates, format='%m/%d/%y'))
+    return [c for c, d in zip(dates, parsed) if d > grouped.index[-1]]
+
+
+def raw_hash(raw_data, date_columns):
+    """Hash of the id columns and the given date columns of a raw frame."""
+    digest = hashlib.sha256()
+    for col in ('Country/Region', 'Province/State'):
+        digest.update('\0'.join(map(str, raw_data[col])).encode())
+    digest.update('\0'.join(date_columns).encode())
+    digest.update(np.ascontiguousarray(
+        raw_data[list(date_columns)].to_numpy(dtype='float64', na_value=np.nan)).tobytes())
+    return digest.hexdigest()
+
+
+def append_new_dates(raw_data, grouped):
+    """Append the date columns of ``raw_data`` missing from ``grouped``.
+
+    ``raw_data`` only needs the id columns plus the new date columns.
+    Returns ``(frame, n_new_rows)``, or ``(None, 0)`` when the set of
+    countries changed and a full ``group_by_country`` is needed instead.
+    """
+    new_dates = new_date_columns(raw_data.columns, grouped)
+    if not new_dates:
+        return grouped, 0
+
+    update = group_by_country(raw_data[ID_COLUMNS + new_dates])
+    if not update.columns.equals(grouped.columns):
+        return None, 0
+    dtype = grouped.dtypes.iloc[0]
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iu':
+        # Compacted counts (e.g. uint16) are widened when the new values need it
+        dtype = np.result_type(dtype, smallest_int_dtype(
+            update.to_numpy(dtype='float64', na_value=np.nan)))
+    return pd.concat([grouped.astype(dtype), update.astype(dtype)]), len(new_dates)
+
+
+def first_crossings(grouped, min_val):
+    """Row of the first value >= ``min_val`` for every column that reaches it."""
+    reached, first, _ = crossing_days(grouped.to_numpy(dtype='float64', na_value=np.nan), min_val)
+    return pd.Series(first[reached], index=grouped.columns[reached])
+
+
+def append_aligned(aligned, first, grouped, n_previous, min_val):
+    """Extend ``align_curves`` output after rows were appended to ``grouped``.
+
+    ``aligned`` and ``first`` (from :func:`first_crossings`) describe the
+    first ``n_previous`` rows of ``grouped``.  Returns the updated
+    ``(aligned, first)``, equal to recomputing both on the whole frame.
+    """
+    n_days = len(grouped)
+    new_values = grouped.iloc[n_previous:].to_numpy(dtype='float64', na_value=np.nan)
+
+    # Only countries without a crossing yet can gain one in the new rows
+    pending = ~grouped.columns.isin(first.index)
+    reached, offset, _ = crossing_days(new_values[:, pending], min_val)
+    crossed = pd.Series(n_previous + offset[reached], index=grouped.columns[pending][reached])
+    first = pd.concat([first, crossed])
+    first = first.reindex(grouped.columns[grouped.columns.isin(first.index)])
+
+    out = np.full((n_days, len(first)), np.nan)
+    old_cols = first.index.get_indexer(aligned.columns)
+    out[:len(aligned), old_cols] = aligned.to_numpy(dtype='float64', na_value=np.nan)
+
+    # Scatter the new rows of every aligned country to day (row - first)
+    columns = grouped.columns.get_indexer(first.index)
+    values = new_values[:, columns]
+    values = np.where(values >= min_val, values, np.nan)
+    rows = np.arange(n_previous, n_days)[:, None] - first.to_numpy()[None, :]
+    valid = rows >= 0
+    out[rows[valid], np.broadcast_to(np.arange(len(first)), rows.shape)[valid]] = values[valid]
+
+    return pd.DataFrame(out, columns=first.index), first
+
+
+def refresh(urls, snapshot_dir, cache_dir=None):
+    """Bring the snapshot of ``{name: url}`` up to date, appending new days.
+
+    Returns ``(frames, n_new_rows)``; ``n_new_rows`` maps each name to the
+    number of appended rows.  Metrics without a previous snapshot, or whose
+    already stored columns were revised upstream, are rebuilt from scratch.
+    """
+    paths = {name: fetch(url, cache_dir=cache_dir)[0] for name, url in urls.items()}
+    source = source_hash(paths.values())
+    current = load_snapshot(snapshot_dir, source)
+    if current is not None and set(current) == set(paths):
+        return current, dict.fromkeys(paths, 0)
+
+    # Copies rather than memory maps: the .npy files are rewritten below
+    stored = load_snapshot(snapshot_dir, mmap=False) or {}
+    stored_hashes = {name: meta.get('raw_hash') for name, meta in
+                     ((read_index(snapshot_dir) or {}).get('metrics') or {}).items()}
+    frames, added, hashes = {}, {}, {}
+    for name, path in paths.items():
+        raw = read_jhu_csv(path)
+        dates = [c for c in raw.columns if c not in ID_COLUMNS]
+        hashes[name] = {'raw_hash': raw_hash(raw, dates)}
+        frame, previous = None, stored.get(name)
+        if previous is not None:
+            new_dates = new_date_columns(dates, previous)
+            old_dates = [c for c in dates if c not in set(new_dates)]
+            # Only append when the columns we already have are unchanged upstream
+            if stored_hashes.get(name) == raw_hash(raw, old_dates):
+                frame, added[name] = append_new_dates(raw[ID_COLUMNS + new_dates], previous)
+            if frame is not None and len(frame) != len(dates):
+                frame = None
+        if frame is None:
+            frame = group_by_country(raw)
+            added[name] = len(frame) - (0 if previous is None else len(previous))
+        frames[name] = frame
+    save_snapshot(frames, snapshot_dir, source, extra=hashes)
+    return frames, added
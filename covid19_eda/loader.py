@@ -0,0 +1,74 @@
+"""Concurrent loader for the three JHU global time-series CSVs.
+
+The downloads and parses run on a thread pool (pandas' C parser releases the
+GIL for most of the work) and every file is read with the same explicit
+dtype map, built once from the header: categorical ``Province/State`` and
+``Country/Region`` and int32 counts instead of inferred int64/float64.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from covid19_eda.fetch import fetch
+from covid19_eda.profiling import instrument
+
+BASE_URL = ('https://raw.githubusercontent.com/CSSEGISandData/COVID-19/master/'
+            'csse_covid_19_data/csse_covid_19_time_series/')
+URLS = {
+    'confirmed': BASE_URL + 'time_series_covid19_confirmed_global.csv',
+    'deaths': BASE_URL + 'time_series_covid19_deaths_global.csv',
+    'recovered': BASE_URL + 'time_series_covid19_recovered_global.csv',
+}
+
+CATEGORY_COLUMNS = ('Province/State', 'Country/Region')
+FLOAT_COLUMNS = ('Lat', 'Long')
+# Every column of the wide files that is not a date
+ID_COLUMNS = list(CATEGORY_COLUMNS + FLOAT_COLUMNS)
+
+
+def jhu_dtypes(header, count_dtype='int32'):
+    """Explicit dtype map for a JHU wide-format header."""
+    dtypes = {}
+    for col in header:
+        if col in CATEGORY_COLUMNS:
+            dtypes[col] = 'category'
+        elif col in FLOAT_COLUMNS:
+            dtypes[col] = 'float64'
+        else:
+            dtypes[col] = count_dtype
+    return dtypes
+
+
+@instrument('parse')
+def read_jhu_csv(path, dtypes=None, **kwargs):
+    """``pd.read_csv`` with the compact dtype map.
+
+    Files with missing counts can't be read as int32, so those fall back to
+    the nullable ``Int32`` dtype.
+    """
+    if dtypes is None:
+        dtypes = jhu_dtypes(pd.read_csv(path, nrows=0).columns)
+    try:
+        return pd.read_csv(path, dtype=dtypes, **kwargs)
+    except ValueError:
+        nullable = {col: 'Int32' if dtype == 'int32' else dtype for col, dtype in dtypes.items()}
+        return pd.read_csv(path, dtype=nullable, **kwargs)
+
+
+@instrument('load')
+def load_raw(urls=None, cache_dir=None, max_workers=3):
+    """Download and parse the time-series CSVs concurrently.
+
+    ``urls`` maps names to URLs (default :data:`URLS`); the raw frames are
+    returned as a tuple in the same order.
+    """
+    urls = urls or URLS
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        paths = list(pool.map(lambda url: fetch(url, cache_dir=cache_dir)[0], urls.values()))
+        # Build the dtype map once; columns a file lacks are simply ignored
+        dtypes = jhu_dtypes(pd.read_csv(paths[0], nrows=0).columns)
+        for path in paths[1:]:
+            dtypes.update((col, dtype) for col, dtype in jhu_dtypes(
+                pd.read_csv(path, nrows=0).columns).items() if col not in dtypes)
+        return tuple(pool.map(lambda path: read_jhu_csv(path, dtypes), paths))
@@ -0,0 +1,73 @@
+"""Streaming long-format export of aligned curves for Altair.
+
+``aligned.reset_index().melt(...).dropna()`` materializes the full day x
+country product, NaN padding included, before trimming it.  Here only the
+valid ``(Day, Country, value)`` records are produced, a block of columns at
+a time, and can be written straight to a CSV or JSON file that an Altair
+chart loads by URL instead of inlining the data in the spec.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.profiling import instrument
+
+
+def iter_long(aligned, value_name, chunk_columns=256):
+    """Yield long-format frames of the non-NaN cells of ``aligned``.
+
+    Records come out in the same order as ``melt`` followed by ``dropna``
+    (country by country, then by day).
+    """
+    country = aligned.columns.name or 'variable'
+    days = aligned.index.to_numpy()
+    for start in range(0, aligned.shape[1], chunk_columns):
+        block = aligned.iloc[:, start:start + chunk_columns]
+        values = block.to_numpy(dtype='float64', na_value=np.nan).T
+        col, day = np.nonzero(~np.isnan(values))
+        if not len(col):
+            continue
+        yield pd.DataFrame({
+            'Day': days[day],
+            country: block.columns.to_numpy()[col],
+            value_name: values[col, day],
+        })
+
+
+@instrument('melt')
+def long_frame(aligned, value_name, chunk_columns=256):
+    """All of :func:`iter_long` as one frame, with a fresh RangeIndex."""
+    chunks = list(iter_long(aligned, value_name, chunk_columns))
+    if not chunks:
+        return pd.DataFrame(columns=['Day', aligned.columns.name or 'variable', value_name])
+    return pd.concat(chunks, ignore_index=True)
+
+
+def write_long(aligned, path, value_name, chunk_columns=256):
+    """Stream the long records of ``aligned`` to a ``.csv`` or ``.json`` file.
+
+    JSON is written as an array with one record per line, which Vega-Lite
+    can load by URL.  Returns the number of records written.
+    """
+    fmt = os.path.splitext(path)[1].lower()
+    if fmt not in ('.csv', '.json'):
+        raise ValueError('unsupported long-format file type: %r' % fmt)
+
+    count = 0
+    with open(path, 'w', newline='') as f:
+        if fmt == '.json':
+            f.write('[')
+        for chunk in iter_long(aligned, value_name, chunk_columns):
+            if fmt == '.csv':
+                chunk.to_csv(f, header=not count, index=False)
+            else:
+                records = chunk.to_json(orient='records', lines=True).splitlines()
+                f.write((',\n' if count else '\n') + ',\n'.join(records))
+            count += len(chunk)
+        if fmt == '.json':
+            f.write('\n]\n')
+        elif not count:
+            f.write(','.join(['Day', aligned.columns.name or 'variable', value_name]) + '\n')
+    return count
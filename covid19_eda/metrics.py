@@ -0,0 +1,128 @@
+"""Derived metrics computed on the grouped date x country frames.
+
+Every metric works on the whole 2-D array at once: daily deltas with
+``np.diff``, rolling means from a cumulative sum, case-fatality ratios by
+element-wise division and doubling times from the slope of the log counts.
+:func:`get_metric` caches results by a hash of the input frames, so asking
+for the same metric on the same data again is free.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+CACHE_SIZE = 64
+_cache = OrderedDict()
+
+
+def _values(frame):
+    values = frame.to_numpy()
+    if values.dtype.kind in 'iu':
+        # Widen compacted counts: differences of small or unsigned ints wrap
+        values = values.astype('int64')
+    elif values.dtype.kind != 'f':
+        values = frame.to_numpy(dtype='float64', na_value=np.nan)
+    return values
+
+
+def _like(frame, values):
+    return pd.DataFrame(values, index=frame.index, columns=frame.columns)
+
+
+def daily_new(frame):
+    """Day-over-day increase of a cumulative frame; the first row is kept as is."""
+    values = _values(frame)
+    return _like(frame, np.diff(values, axis=0, prepend=np.zeros_like(values[:1])))
+
+
+def rolling_mean(frame, window=7):
+    """Trailing ``window``-row mean; the first ``window - 1`` rows are NaN.
+
+    Missing values count as zero.
+    """
+    values = np.nan_to_num(_values(frame).astype('float64'))
+    total = np.cumsum(values, axis=0)
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        out[window - 1] = total[window - 1]
+        out[window:] = total[window:] - total[:-window]
+        out[window - 1:] /= window
+    return _like(frame, out)
+
+
+def case_fatality_ratio(confirmed, deaths):
+    """Deaths over confirmed cases, NaN where nothing is confirmed yet."""
+    deaths = deaths.reindex(index=confirmed.index, columns=confirmed.columns)
+    num = _values(deaths).astype('float64')
+    den = _values(confirmed).astype('float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = np.where(den > 0, num / den, np.nan)
+    return _like(confirmed, out)
+
+
+def doubling_time(frame, window=7):
+    """Days for the cumulative count to double, from the last ``window`` days.
+
+    Uses the slope of ``log(count)`` over the window; NaN where the count is
+    not positive or did not grow.
+    """
+    values = _values(frame).astype('float64')
+    out = np.full(values.shape, np.nan)
+    if len(values) > window:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            logs = np.log(np.where(values > 0, values, np.nan))
+            slope = (logs[window:] - logs[:-window]) / window
+            out[window:] = np.where(slope > 0, np.log(2) / slope, np.nan)
+    return _like(frame, out)
+
+
+def compute_metrics(confirmed, deaths=None, window=7):
+    """All metrics for ``confirmed`` (and ``deaths``) as ``{name: frame}``."""
+    metrics = {}
+    metrics['daily_new'] = daily_new(confirmed)
+    metrics['rolling_new'] = rolling_mean(metrics['daily_new'], window)
+    metrics['doubling_time'] = doubling_time(confirmed, window)
+    if deaths is not None:
+        metrics['daily_deaths'] = daily_new(deaths)
+        metrics['rolling_deaths'] = rolling_mean(metrics['daily_deaths'], window)
+        metrics['case_fatality_ratio'] = case_fatality_ratio(confirmed, deaths)
+    return metrics
+
+
+METRICS = {
+    'daily_new': daily_new,
+    'rolling_mean': rolling_mean,
+    'case_fatality_ratio': case_fatality_ratio,
+    'doubling_time': doubling_time,
+    'all': compute_metrics,
+}
+
+
+def frame_hash(frame):
+    """Content hash of a frame's values, index and columns."""
+    digest = hashlib.sha1()
+    # Hash the values, not the raw buffer: nullable columns come out of
+    # to_numpy() as object arrays, whose bytes are pointers
+    digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    digest.update(str(frame.dtypes.tolist()).encode())
+    digest.update('\0'.join(map(str, frame.columns)).encode())
+    return digest.hexdigest()
+
+
+def get_metric(name, *frames, **params):
+    """Cached ``METRICS[name](*frames, **params)``.
+
+    The cache holds the last :data:`CACHE_SIZE` results, keyed by the
+    metric, its parameters and the content hash of each input frame.
+    Returned frames are shared between callers, so don't modify them.
+    """
+    key = (name, tuple(frame_hash(f) for f in frames), tuple(sorted(params.items())))
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+    result = _cache[key] = METRICS[name](*frames, **params)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return result
@@ -0,0 +1,19 @@
+"""pyplot helpers used by the notebook flow.
+
+matplotlib is imported on first use, so importing this module stays cheap.
+"""
+
+from covid19_eda.profiling import instrument
+
+
+# Function to plot time series
+@instrument('plot_time_series')
+def plot_time_series(df, plot_title, x_label, y_label, logy=False):
+    import matplotlib.pyplot as plt
+
+    ax = df.plot(figsize=(20,10), linewidth=2, marker='.', fontsize=20, logy=logy)
+    ax.legend(ncol=3, loc='lower right')
+    plt.xlabel(x_label, fontsize=20);
+    plt.ylabel(y_label, fontsize=20);
+    plt.title(plot_title, fontsize=20);
+    return ax
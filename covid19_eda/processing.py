@@ -0,0 +1,74 @@
+"""Grouping and curve alignment for the JHU time-series frames."""
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.compact import nullable_frame, smallest_int_dtype
+from covid19_eda.profiling import instrument
+
+
+# Function for grouping countries by region
+@instrument('group_by_country')
+def group_by_country(raw_data):
+
+    # Group by (numeric columns only, so Province/State is not summed)
+    data = raw_data.drop(columns=['Province/State'], errors='ignore')
+    data = data.groupby(['Country/Region'], observed=True).sum().drop(['Lat', 'Long'], axis=1)
+    # Transpose
+    data = data.transpose()
+    # A categorical Country/Region would otherwise leave a CategoricalIndex
+    if isinstance(data.columns, pd.CategoricalIndex):
+        data.columns = data.columns.astype(data.columns.categories.dtype)
+    # Set index as DateTimeIndex
+    datetime_index = pd.DatetimeIndex(data.index)
+    data.set_index(datetime_index, inplace=True)
+    return data
+
+
+def crossing_days(values, min_val):
+    """Find the threshold crossing of every column of a 2-D day x country array.
+
+    Returns ``(reached, first, mask)``: ``reached`` flags the columns with at
+    least one value >= ``min_val``, ``first`` holds the row of the first such
+    value (0 where not reached) and ``mask`` is the element-wise comparison.
+    """
+    mask = values >= min_val
+    return mask.any(axis=0), mask.argmax(axis=0), mask
+
+
+# Function to align growth curves
+@instrument('align_curves')
+def align_curves(data, min_val, compact=False):
+    """Align each column of ``data`` to start on its first day >= ``min_val``.
+
+    Values below ``min_val`` become NaN, columns that never reach it are
+    dropped and the result is a float64 frame indexed by day number.  The
+    input frame is left untouched; the output matches the original loop-based
+    implementation.  With ``compact=True`` the result instead uses the
+    smallest nullable integer dtype holding the counts (e.g. ``UInt32``).
+    """
+    values = data.to_numpy(dtype='float64', na_value=np.nan)
+    n_days = values.shape[0]
+    reached, first, mask = crossing_days(values, min_val)
+    keep = np.flatnonzero(reached)
+    mask = mask[:, keep]
+
+    # Rows to gather for every shifted column; row n_days is padding used
+    # whenever a shifted column runs past the last day
+    rows = np.arange(n_days)[:, None] + first[keep][None, :]
+    np.minimum(rows, n_days, out=rows)
+    cols = np.arange(len(keep))[None, :]
+
+    if compact:
+        counts = np.where(mask, values[:, keep], 0)
+        dtype = smallest_int_dtype(counts)
+        padded = np.zeros((n_days + 1, len(keep)), dtype=dtype)
+        padded[:n_days] = counts
+        valid = np.zeros((n_days + 1, len(keep)), dtype=bool)
+        valid[:n_days] = mask
+        return nullable_frame(padded[rows, cols], valid[rows, cols], data.columns[keep])
+
+    # Blank values below the threshold, then gather every shifted column in one go
+    padded = np.full((n_days + 1, len(keep)), np.nan)
+    padded[:n_days] = np.where(mask, values[:, keep], np.nan)
+    return pd.DataFrame(padded[rows, cols], columns=data.columns[keep])
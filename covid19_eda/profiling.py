@@ -0,0 +1,164 @@
+"""Opt-in stage instrumentation for the load / transform / plot pipeline.
+
+Functions decorated with :func:`instrument` (and blocks wrapped in
+:func:`stage`) record their wall time, the shape of their result and,
+optionally, the traced memory delta and a cProfile dump per call.  When
+tracing is off the wrapper is a single ``None`` check before the call.
+Traces export to Chrome trace-event JSON (``chrome://tracing``, Perfetto).
+"""
+
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+_trace = None
+
+
+class Trace:
+    """Events recorded while tracing was enabled."""
+
+    def __init__(self, memory=False, profile_dir=None):
+        self.memory = memory
+        self.profile_dir = profile_dir
+        self.events = []
+        # Whether enable() started tracemalloc and so disable() should stop it
+        self.started_tracemalloc = False
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, event):
+        with self._lock:
+            event['seq'] = len(self.events)
+            self.events.append(event)
+
+    def to_chrome(self, path):
+        """Write the events as Chrome trace-event JSON to ``path``."""
+        events = [{
+            'name': e['stage'], 'cat': 'covid19_eda', 'ph': 'X', 'pid': os.getpid(),
+            'tid': e['thread'], 'ts': (e['start'] - self._origin) * 1e6,
+            'dur': e['duration'] * 1e6,
+            'args': {k: v for k, v in e.items()
+                     if k not in ('stage', 'thread', 'start', 'duration')},
+        } for e in self.events]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+    def summary(self):
+        """``{stage: (calls, total seconds)}`` over all recorded events."""
+        totals = {}
+        for e in self.events:
+            calls, seconds = totals.get(e['stage'], (0, 0.0))
+            totals[e['stage']] = (calls + 1, seconds + e['duration'])
+        return totals
+
+
+def enable(memory=False, profile_dir=None):
+    """Start recording; ``memory`` turns on tracemalloc deltas and
+    ``profile_dir`` writes one cProfile dump per stage call there."""
+    global _trace
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+    trace = Trace(memory, profile_dir)
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        trace.started_tracemalloc = True
+    _trace = trace
+    return _trace
+
+
+def disable():
+    """Stop recording and return the finished :class:`Trace` (or None)."""
+    global _trace
+    trace, _trace = _trace, None
+    if trace is not None and trace.started_tracemalloc:
+        tracemalloc.stop()
+    return trace
+
+
+@contextmanager
+def tracing(path=None, memory=False, profile_dir=None):
+    """Record everything in the block, writing Chrome JSON to ``path`` if given."""
+    trace = enable(memory, profile_dir)
+    try:
+        yield trace
+    finally:
+        disable()
+        if path:
+            trace.to_chrome(path)
+
+
+def _shape(result):
+    if isinstance(result, tuple):
+        return [_shape(r) for r in result]
+    shape = getattr(result, 'shape', None)
+    return list(shape) if shape is not None else None
+
+
+_profiler_lock = threading.Lock()
+_profiler_active = False
+
+
+def _start_profiler():
+    # Only one profiler can run at a time, so nested and concurrent stages
+    # are covered by the dump of the outermost one
+    global _profiler_active
+    with _profiler_lock:
+        if _profiler_active:
+            return None
+        _profiler_active = True
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _stop_profiler(profiler):
+    global _profiler_active
+    profiler.disable()
+    with _profiler_lock:
+        _profiler_active = False
+
+
+@contextmanager
+def stage(name, **info):
+    """Record a block as one stage; yields a dict for extra event fields."""
+    trace = _trace
+    if trace is None:
+        yield {}
+        return
+    event = dict(info, stage=name, thread=threading.get_ident())
+    before = tracemalloc.get_traced_memory()[0] if trace.memory else None
+    profiler = _start_profiler() if trace.profile_dir else None
+    event['start'] = time.perf_counter()
+    try:
+        yield event
+    finally:
+        if profiler:
+            _stop_profiler(profiler)
+        event['duration'] = time.perf_counter() - event['start']
+        if before is not None:
+            event['memory_delta'] = tracemalloc.get_traced_memory()[0] - before
+        trace.add(event)
+        if profiler:
+            profiler.dump_stats(os.path.join(
+                trace.profile_dir, '%04d-%s.prof' % (event['seq'], name)))
+
+
+def instrument(name):
+    """Decorator recording each call of the function as stage ``name``."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _trace is None:
+                return func(*args, **kwargs)
+            with stage(name, input_shape=_shape(args[0]) if args else None) as event:
+                result = func(*args, **kwargs)
+                event['output_shape'] = _shape(result)
+            return result
+        return wrapper
+    return decorate
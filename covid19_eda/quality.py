@@ -0,0 +1,129 @@
+"""Vectorized validation and repair of cumulative count series.
+
+JHU cumulative series contain downward corrections and retroactive dumps,
+which show up as negative daily deltas and make ``align_curves`` pick
+spurious crossing days.  :func:`check_quality` flags, for every column at
+once, points that fall below an earlier value, daily increases far above
+the recent trend and series that stopped changing, repairs the drops with
+the selected policy and summarises the anomalies per column.  Spikes and
+stale series are only reported, never repaired.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.profiling import instrument
+
+QualityResult = namedtuple('QualityResult', 'repaired flags report')
+
+
+def _trailing_mean(values, window):
+    # Mean of the up to ``window`` rows before each row (0 for the first row)
+    total = np.zeros((len(values) + 1,) + values.shape[1:])
+    np.cumsum(values, axis=0, out=total[1:])
+    rows = np.arange(len(values))
+    start = np.maximum(rows - window, 0)
+    count = np.maximum(rows - start, 1)[:, None]
+    return (total[rows] - total[start]) / count
+
+
+def _redistribute(values):
+    # Anchors are the points no later value falls below; they keep their
+    # value, and the rise between consecutive anchors is spread over the
+    # days in between in proportion to their positive daily increments.
+    # A virtual anchor at level 0 (or the lowest value) precedes day 0.
+    low = np.minimum.accumulate(values[::-1], axis=0)[::-1]
+    levels = np.concatenate([np.minimum(low[:1], 0), values])
+    anchor = np.concatenate([np.ones_like(low[:1], dtype=bool), values == low])
+    rows = np.broadcast_to(np.arange(len(levels))[:, None], levels.shape)
+    prev = np.maximum.accumulate(np.where(anchor, rows, 0), axis=0)[:-1]
+    nxt = np.minimum.accumulate(np.where(anchor, rows, len(levels))[::-1], axis=0)[::-1][1:]
+
+    increments = np.zeros(levels.shape)
+    increments[1:] = np.maximum(np.diff(levels, axis=0), 0)
+    done = np.cumsum(increments, axis=0)
+    start = np.take_along_axis(done, prev, axis=0)
+    total = np.take_along_axis(done, nxt, axis=0) - start
+    with np.errstate(divide='ignore', invalid='ignore'):
+        share = np.where(total > 0, (done[1:] - start) / total, 1.0)
+    base = np.take_along_axis(levels, prev, axis=0)
+    return base + (np.take_along_axis(levels, nxt, axis=0) - base) * share
+
+
+def repair(values, policy):
+    """Make every column of a 2-D cumulative array non-decreasing.
+
+    ``'cummax'`` carries the running maximum forward, so a drop is held at
+    the previous level until the series catches up.  ``'redistribute'``
+    trusts the later, corrected level: each drop is spread back over the
+    days since the last value below it, in proportion to their daily
+    increments, so ``[100, 200, 300, 5, 310]`` becomes
+    ``[1.67, 3.33, 5, 5, 310]``.  ``None`` leaves the values as they are.
+    """
+    if policy is None:
+        return values
+    if policy == 'cummax':
+        return np.maximum.accumulate(values, axis=0)
+    if policy == 'redistribute':
+        return _redistribute(np.asarray(values, dtype='float64'))
+    raise ValueError('unknown repair policy: %r' % (policy,))
+
+
+@instrument('check_quality')
+def check_quality(frame, policy='cummax', spike_factor=10, spike_window=7, min_spike=100,
+                  stale_days=14):
+    """Flag and repair anomalies in a ``group_by_country``-style frame.
+
+    A point is *non-monotonic* when it is below the running maximum of the
+    days before it, and a *spike* when its daily increase exceeds both
+    ``min_spike`` and ``spike_factor`` times the mean increase of the
+    previous ``spike_window`` days.  A series is *stale* when it has not
+    changed for at least ``stale_days`` days at the end.  Missing values
+    carry the previous value forward before any check.  Only the
+    non-monotonic points are repaired (with ``policy``, see :func:`repair`);
+    spikes and stale series are flagged and reported as they are.
+
+    Returns a :class:`QualityResult` with the repaired frame, the boolean
+    day x column ``flags`` arrays and a per-column ``report`` of the columns
+    with at least one anomaly.
+    """
+    values = frame.to_numpy(dtype='float64', na_value=np.nan)
+    n_days = len(values)
+    # Gaps carry the last reported value forward (0 before the first one);
+    # zero-filling would make a gap look like a trusted correction
+    rows = np.where(np.isnan(values), 0, np.arange(n_days)[:, None])
+    values = values[np.maximum.accumulate(rows, axis=0), np.arange(values.shape[1])]
+    values = np.where(np.isnan(values), 0, values)
+
+    running = np.maximum.accumulate(values, axis=0)
+    non_monotonic = np.zeros(values.shape, dtype=bool)
+    non_monotonic[1:] = values[1:] < running[:-1]
+
+    daily = np.diff(values, axis=0, prepend=values[:1])
+    trend = _trailing_mean(np.maximum(daily, 0), spike_window)
+    spikes = (daily > min_spike) & (daily > spike_factor * trend)
+    spikes[0] = False
+
+    changed = daily != 0
+    changed[0] = True
+    last_change = n_days - 1 - changed[::-1].argmax(axis=0)
+    stale = (n_days - 1 - last_change) >= stale_days
+
+    repaired = repair(values, policy)
+    if frame.dtypes.map(lambda d: d.kind in 'iu').all():
+        repaired = np.rint(repaired).astype(frame.dtypes.iloc[0])
+    repaired = pd.DataFrame(repaired, index=frame.index, columns=frame.columns)
+
+    report = pd.DataFrame({
+        'non_monotonic': non_monotonic.sum(axis=0),
+        'largest_drop': np.max(running - values, axis=0),
+        'spikes': spikes.sum(axis=0),
+        'stale': stale,
+        'last_change': frame.index[last_change],
+    }, index=frame.columns)
+    report = report[(report['non_monotonic'] > 0) | (report['spikes'] > 0) | report['stale']]
+
+    flags = {'non_monotonic': non_monotonic, 'spikes': spikes}
+    return QualityResult(repaired, flags, report)
@@ -0,0 +1,92 @@
+"""Indexed queries over the grouped date x country matrices.
+
+:class:`SeriesQuery` keeps the dates as a sorted index, a
+country-name -> column dictionary and, per metric, the running maximum and
+the per-day sort order of the values.  Range slices and "first day above
+threshold" are then binary searches, "countries above N on day D" is a
+binary search in that day's sorted row, and top-k growth reads the end of
+a precomputed ranking.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class SeriesQuery:
+    """Query layer over ``{metric: grouped frame}`` sharing dates and countries."""
+
+    def __init__(self, frames):
+        first = next(iter(frames.values()))
+        self.dates = first.index
+        self.countries = first.columns
+        self._columns = {country: i for i, country in enumerate(first.columns)}
+        self._values, self._cummax, self._order, self._sorted = {}, {}, {}, {}
+        for metric, frame in frames.items():
+            frame = frame.reindex(index=self.dates, columns=self.countries)
+            values = frame.to_numpy(dtype='float64', na_value=np.nan)
+            self._values[metric] = values
+            ranked = np.where(np.isnan(values), -np.inf, values)
+            # Running maxima are monotone, so crossings are a binary search;
+            # column-major so each country's series is contiguous
+            self._cummax[metric] = np.asfortranarray(np.maximum.accumulate(ranked, axis=0))
+            self._order[metric] = np.argsort(ranked, axis=1, kind='stable')
+            self._sorted[metric] = np.take_along_axis(ranked, self._order[metric], axis=1)
+        self._growth = {}
+
+    def _row(self, date):
+        # Last available date on or before ``date``
+        row = self.dates.searchsorted(pd.Timestamp(date), side='right') - 1
+        if row < 0:
+            raise KeyError('no data on or before %s' % date)
+        return row
+
+    def _column(self, country):
+        try:
+            return self._columns[country]
+        except KeyError:
+            raise KeyError('unknown country: %r' % (country,)) from None
+
+    def slice(self, metric, countries=None, start=None, end=None):
+        """Frame of ``metric`` for ``countries`` between inclusive dates."""
+        lo = 0 if start is None else self.dates.searchsorted(pd.Timestamp(start))
+        hi = len(self.dates) if end is None else self.dates.searchsorted(
+            pd.Timestamp(end), side='right')
+        values = self._values[metric][lo:hi]
+        if countries is None:
+            return pd.DataFrame(values, index=self.dates[lo:hi], columns=self.countries)
+        cols = [self._column(c) for c in countries]
+        return pd.DataFrame(values[:, cols], index=self.dates[lo:hi],
+                            columns=self.countries[cols])
+
+    def value(self, metric, country, date):
+        """Value of ``metric`` for ``country`` on (or just before) ``date``."""
+        return self._values[metric][self._row(date), self._column(country)]
+
+    def above(self, metric, threshold, date):
+        """Countries with ``metric >= threshold`` on ``date``, largest first."""
+        row = self._row(date)
+        pos = np.searchsorted(self._sorted[metric][row], threshold, side='left')
+        cols = self._order[metric][row, pos:][::-1]
+        return pd.Series(self._values[metric][row, cols], index=self.countries[cols])
+
+    def first_day_above(self, metric, country, threshold):
+        """First date ``country`` reached ``threshold``, or None if it never did."""
+        running = self._cummax[metric][:, self._column(country)]
+        row = np.searchsorted(running, threshold, side='left')
+        return self.dates[row] if row < len(self.dates) else None
+
+    def top_k(self, metric, k, date=None, window=7):
+        """The ``k`` countries with the largest growth over ``window`` days.
+
+        The ranking for a (metric, window) pair is computed once and reused.
+        """
+        key = (metric, window)
+        if key not in self._growth:
+            values = self._values[metric]
+            growth = np.full(values.shape, -np.inf)
+            growth[window:] = np.nan_to_num(values[window:] - values[:-window], nan=-np.inf)
+            self._growth[key] = growth, np.argsort(growth, axis=1, kind='stable')
+        growth, order = self._growth[key]
+        row = len(self.dates) - 1 if date is None else self._row(date)
+        cols = order[row, ::-1][:k]
+        return pd.Series(growth[row, cols], index=self.countries[cols])
@@ -0,0 +1,73 @@
+"""Headless batch rendering of time-series figures.
+
+``plot_time_series`` draws through the pyplot state machine and never
+closes its figures.  Here every job is drawn on a standalone Agg
+``Figure`` (never registered with pyplot, so nothing accumulates), written
+to disk and dropped, with the jobs spread across a process pool.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from covid19_eda.profiling import instrument
+
+
+def _use_agg():
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+@instrument('render_figure')
+def render_figure(frame, path, plot_title, x_label, y_label, logy=False):
+    """Draw ``frame`` like ``plot_time_series`` and save it to ``path``."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(20, 10))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    for col in frame.columns:
+        ax.plot(frame.index, frame[col], linewidth=2, marker='.', label=col)
+    if logy:
+        ax.set_yscale('log')
+    ax.tick_params(labelsize=20)
+    ax.legend(ncol=3, loc='lower right')
+    ax.set_xlabel(x_label, fontsize=20)
+    ax.set_ylabel(y_label, fontsize=20)
+    ax.set_title(plot_title, fontsize=20)
+    fig.savefig(path)
+    return path
+
+
+def _render_job(args):
+    return render_figure(*args)
+
+
+def job_path(out_dir, number, title, fmt):
+    """File name for the ``number``-th job, derived from its title."""
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', title).strip('-').lower() or 'figure'
+    return os.path.join(out_dir, '%04d-%s.%s' % (number, slug, fmt))
+
+
+def render_batch(jobs, out_dir, fmt='png', x_label='Days', y_label='Count', processes=None):
+    """Render ``(frame, columns, title, logy)`` jobs to ``out_dir``.
+
+    Returns ``(paths, figures_per_second)``.  ``processes=0`` renders in
+    the current process, which is handy for small batches.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    # Only the columns a job plots are sent to the workers
+    tasks = [(frame[list(columns)], job_path(out_dir, i, title, fmt), title, x_label, y_label, logy)
+             for i, (frame, columns, title, logy) in enumerate(jobs)]
+
+    start = time.perf_counter()
+    if processes == 0:
+        _use_agg()
+        paths = [_render_job(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_use_agg) as pool:
+            paths = list(pool.map(_render_job, tasks, chunksize=max(1, len(tasks) // 32)))
+    elapsed = time.perf_counter() - start
+    return paths, len(paths) / elapsed if elapsed else float('inf')
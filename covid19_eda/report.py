@@ -0,0 +1,161 @@
+"""Static HTML report with a content-addressed artifact cache.
+
+Every chart is keyed by a hash of its input slice, its kind and its
+parameters.  The rendered artifact (a PNG for matplotlib charts, a
+Vega-Lite JSON spec for the interactive chart) is stored under that hash,
+so a chart whose inputs did not change since the last build is copied from
+the cache instead of being drawn again.  Per-country charts are trimmed to
+the last day their series changed, so countries that stopped reporting keep
+hitting the cache while new dates are appended.
+"""
+
+import hashlib
+import html
+import json
+import os
+import shutil
+from collections import namedtuple
+
+from covid19_eda.metrics import frame_hash
+from covid19_eda.processing import align_curves
+
+# Bump when the rendering code changes, to invalidate cached artifacts
+RENDER_VERSION = '1'
+COUNTRIES = ['China', 'US', 'Italy', 'France', 'Spain', 'Australia', 'India']
+
+ReportChart = namedtuple('ReportChart', 'name title kind frame params')
+
+_PAGE = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="https://cdn.jsdelivr.net/npm/vega@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@6"></script>
+</head>
+<body>
+<h1>{title}</h1>
+{sections}
+</body>
+</html>
+'''
+
+
+def trim_stale(frame):
+    """Drop trailing rows equal to the last row where anything changed."""
+    values = frame.to_numpy()
+    changed = (values[1:] != values[:-1]).any(axis=1)
+    last = changed.nonzero()[0]
+    return frame.iloc[:last[-1] + 2] if len(last) else frame.iloc[:1]
+
+
+def default_charts(confirmed, deaths, recovered, countries=COUNTRIES, min_val=25,
+                   per_country=False, max_points=None):
+    """The notebook's charts as :class:`ReportChart` entries.
+
+    With ``per_country`` one confirmed-cases chart per country is added.
+    """
+    countries = [c for c in countries if c in confirmed.columns]
+    deaths_aligned = align_curves(deaths, min_val)
+    recovered_aligned = align_curves(recovered, min_val)
+    aligned_countries = [c for c in countries if c in deaths_aligned.columns]
+    charts = [
+        ReportChart('confirmed', 'Reported Confirmed Cases Time Series', 'figure', confirmed[countries],
+                    {'x_label': 'Date', 'y_label': 'Reported Confirmed cases count', 'logy': True}),
+        ReportChart('deaths', 'Reported Deaths Time Series', 'figure', deaths[countries],
+                    {'x_label': 'Date', 'y_label': 'Number of Reported Deaths', 'logy': True}),
+        ReportChart('deaths_aligned',
+                    'Total reported coronavirus deaths for places with at least %d deaths' % min_val,
+                    'figure', deaths_aligned[aligned_countries],
+                    {'x_label': 'Days', 'y_label': 'Number of Reported Deaths', 'logy': True}),
+        ReportChart('recovered_aligned', 'Recovered Patients Time Series', 'figure',
+                    recovered_aligned[[c for c in countries if c in recovered_aligned.columns]],
+                    {'x_label': 'Days', 'y_label': 'Recovered Patients count', 'logy': True}),
+        ReportChart('deaths_interactive', 'Reported deaths by country (interactive)', 'altair',
+                    deaths_aligned, {'value': 'Deaths', 'max_points': max_points}),
+    ]
+    if per_country:
+        for country in confirmed.columns:
+            charts.append(ReportChart(
+                'confirmed-' + country, 'Confirmed cases: %s' % country, 'figure',
+                trim_stale(confirmed[[country]]),
+                {'x_label': 'Date', 'y_label': 'Reported Confirmed cases count', 'logy': False}))
+    return charts
+
+
+def chart_key(chart):
+    """Content hash of a chart's input slice, kind and parameters."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([RENDER_VERSION, chart.kind, chart.title, chart.params],
+                             sort_keys=True, default=str).encode())
+    digest.update(frame_hash(chart.frame).encode())
+    return digest.hexdigest()
+
+
+def _render(chart, path):
+    if chart.kind == 'figure':
+        from covid19_eda.render import render_figure
+        render_figure(chart.frame, path, chart.title, chart.params['x_label'],
+                      chart.params['y_label'], chart.params['logy'])
+    elif chart.kind == 'altair':
+        import altair as alt
+        from covid19_eda.charts import aligned_chart
+        from covid19_eda.longform import long_frame
+        alt.data_transformers.disable_max_rows()
+        value = chart.params['value']
+        # long_frame names the country column after the frame's columns
+        spec = aligned_chart(long_frame(chart.frame, value), value=value,
+                             country=chart.frame.columns.name or 'variable',
+                             max_points=chart.params['max_points']).to_json()
+        with open(path, 'w') as f:
+            f.write(spec)
+    else:
+        raise ValueError('unknown chart kind: %r' % chart.kind)
+
+
+def _section(chart, artifact_dir, artifact, number):
+    title = html.escape(chart.title)
+    if chart.kind == 'figure':
+        body = '<img src="artifacts/%s" alt="%s" style="max-width:100%%">' % (artifact, title)
+    else:
+        with open(os.path.join(artifact_dir, artifact)) as f:
+            spec = f.read()
+        body = ('<div id="chart%d"></div>\n<script>vegaEmbed("#chart%d", %s);</script>'
+                % (number, number, spec))
+    return '<section>\n<h2>%s</h2>\n%s\n</section>' % (title, body)
+
+
+def build_report(charts, out_dir, cache_dir=None, title='COVID-19 Exploratory Data Analysis'):
+    """Write ``out_dir/index.html`` for ``charts``, rendering only cache misses.
+
+    Artifacts live in ``cache_dir`` (default ``out_dir/artifacts``) and are
+    copied next to the report when the cache is elsewhere.  Returns
+    ``(path, stats)`` with the number of charts, cache hits and hit rate.
+    """
+    artifact_dir = os.path.join(out_dir, 'artifacts')
+    cache_dir = cache_dir or artifact_dir
+    os.makedirs(artifact_dir, exist_ok=True)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    hits, sections = 0, []
+    for number, chart in enumerate(charts):
+        artifact = chart_key(chart) + ('.png' if chart.kind == 'figure' else '.vl.json')
+        cached = os.path.join(cache_dir, artifact)
+        if os.path.exists(cached):
+            hits += 1
+        else:
+            # Render to a temporary name so an interrupted build never caches a partial file
+            tmp = os.path.join(cache_dir, '.tmp-' + artifact)
+            _render(chart, tmp)
+            os.replace(tmp, cached)
+        if os.path.abspath(cache_dir) != os.path.abspath(artifact_dir):
+            shutil.copyfile(cached, os.path.join(artifact_dir, artifact))
+        sections.append(_section(chart, artifact_dir, artifact, number))
+
+    path = os.path.join(out_dir, 'index.html')
+    with open(path, 'w') as f:
+        f.write(_PAGE.format(title=html.escape(title), sections='\n'.join(sections)))
+    stats = {'charts': len(charts), 'hits': hits,
+             'hit_rate': hits / len(charts) if charts else 0.0}
+    return path, stats
@@ -0,0 +1,142 @@
+"""Binary snapshots of the grouped date x country matrices.
+
+A snapshot directory holds one raw ``.npy`` file per metric (confirmed,
+deaths, recovered) plus an ``index.json`` sidecar with the dates, the
+country columns and a hash of the source CSV contents.  Loading memory-maps
+the arrays, so later runs skip both the CSV parse and ``group_by_country``.
+A snapshot whose source hash no longer matches is treated as missing.
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.fetch import fetch
+from covid19_eda.loader import read_jhu_csv
+from covid19_eda.processing import group_by_country
+
+INDEX_FILE = 'index.json'
+
+
+def source_hash(paths):
+    """SHA-256 over the contents of the source files, in order."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def metric_index(dates, columns):
+    """Sidecar entry describing one metric's rows and columns."""
+    return {
+        'dates': [d.strftime('%Y-%m-%d') for d in dates],
+        'columns': [str(c) for c in columns],
+        'columns_name': columns.name,
+    }
+
+
+def write_index(directory, source, metrics):
+    """Write ``index.json`` for ``{name: metric_index(...)}``."""
+    # Written last, so an interrupted save never looks like a valid snapshot
+    tmp = os.path.join(directory, INDEX_FILE + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump({'source_hash': source, 'metrics': metrics}, f)
+    os.replace(tmp, os.path.join(directory, INDEX_FILE))
+
+
+def read_index(directory):
+    """The parsed ``index.json`` of a snapshot, or None if there is none."""
+    try:
+        with open(os.path.join(directory, INDEX_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_array(path, values):
+    """``np.save`` to a temporary file renamed over ``path``.
+
+    Frames still memory-mapped from the old file keep reading the old data
+    instead of seeing it truncated.
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.save(f, values)
+    os.replace(tmp, path)
+
+
+def snapshot_values(frame):
+    """``frame``'s values as a plain numeric array that ``np.save`` won't pickle.
+
+    Nullable columns (``Int32`` when the CSV had gaps) come out of
+    ``to_numpy`` as objects; integer ones are stored as int64 with missing
+    counts as 0, anything else as float64 with NaN.
+    """
+    values = frame.to_numpy()
+    if values.dtype.kind == 'O':
+        kinds = {np.dtype(getattr(dtype, 'numpy_dtype', dtype)).kind for dtype in frame.dtypes}
+        if kinds <= set('iu'):
+            values = frame.to_numpy(dtype='int64', na_value=0)
+        else:
+            values = frame.to_numpy(dtype='float64', na_value=np.nan)
+    return np.ascontiguousarray(values)
+
+
+def save_snapshot(frames, directory, source, extra=None):
+    """Write the ``{name: frame}`` mapping of grouped frames to ``directory``.
+
+    ``extra`` optionally maps names to additional sidecar fields.
+    """
+    os.makedirs(directory, exist_ok=True)
+    metrics = {}
+    for name, frame in frames.items():
+        save_array(os.path.join(directory, name + '.npy'), snapshot_values(frame))
+        metrics[name] = dict(metric_index(frame.index, frame.columns), **(extra or {}).get(name, {}))
+    write_index(directory, source, metrics)
+
+
+def load_snapshot(directory, source=None, mmap=True):
+    """Load a snapshot as ``{name: frame}``, or None if missing or stale.
+
+    With ``mmap=True`` the frames are backed read-only by the ``.npy`` files.
+    """
+    index = read_index(directory)
+    if index is None:
+        return None
+    if source is not None and index.get('source_hash') != source:
+        return None
+
+    frames = {}
+    for name, meta in index['metrics'].items():
+        path = os.path.join(directory, name + '.npy')
+        try:
+            values = np.load(path, mmap_mode='r' if mmap else None)
+        except (OSError, ValueError):
+            return None
+        frames[name] = pd.DataFrame(
+            values, copy=False,
+            index=pd.DatetimeIndex(meta['dates']),
+            columns=pd.Index(meta['columns'], name=meta['columns_name']))
+    return frames
+
+
+def load_grouped(urls, snapshot_dir, cache_dir=None):
+    """Grouped frames for ``{name: url}``, from the snapshot when up to date.
+
+    The CSVs go through the download cache; their contents are hashed and a
+    fresh snapshot is written whenever the hash changes.
+    """
+    paths = {name: fetch(url, cache_dir=cache_dir)[0] for name, url in urls.items()}
+    source = source_hash(paths.values())
+    frames = load_snapshot(snapshot_dir, source)
+    if frames is not None and set(frames) == set(paths):
+        return frames
+
+    frames = {name: group_by_country(read_jhu_csv(path)) for name, path in paths.items()}
+    save_snapshot(frames, snapshot_dir, source)
+    return frames
@@ -0,0 +1,73 @@
+"""Multi-threshold alignment sweep producing a threshold x day x country tensor.
+
+Running ``align_curves`` once per threshold repeats the whole pass for every
+threshold.  The first day a series reaches ``t`` is also the first day its
+running maximum reaches ``t``, and running maxima are sorted, so one
+``np.maximum.accumulate`` gives every threshold's crossing day at once.  A
+single fancy-indexing gather then builds all aligned curves.  The input is
+never modified.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from covid19_eda.profiling import instrument
+
+
+class AlignedSweep(namedtuple('AlignedSweep', 'values thresholds countries')):
+    """``values[i]`` holds the curves aligned at ``thresholds[i]``.
+
+    Countries that never reach a threshold are all-NaN in that slice.
+    """
+
+    def reached(self):
+        """Boolean threshold x country mask of the series that crossed."""
+        return ~np.isnan(self.values[:, 0, :])
+
+    def frame(self, threshold):
+        """One slice as a frame, equal to ``align_curves(data, threshold)``."""
+        i = int(np.flatnonzero(self.thresholds == threshold)[0])
+        keep = self.reached()[i]
+        return pd.DataFrame(self.values[i][:, keep], columns=self.countries[keep])
+
+
+def _sweep_block(values, thresholds, out):
+    n_days, n_cols = values.shape
+    running = np.maximum.accumulate(np.where(np.isnan(values), -np.inf, values), axis=0)
+    # Crossing day per threshold and column: how many running maxima are below it
+    first = (running[None, :, :] < thresholds[:, None, None]).sum(axis=1)
+
+    padded = np.full((n_days + 1, n_cols), np.nan)
+    padded[:n_days] = values
+    rows = np.arange(n_days)[None, :, None] + first[:, None, :]
+    np.minimum(rows, n_days, out=rows)
+    gathered = padded[rows, np.arange(n_cols)[None, None, :]]
+    # Values that later dip below the threshold are blanked, as in align_curves
+    gathered[~(gathered >= thresholds[:, None, None])] = np.nan
+    out[...] = gathered
+
+
+@instrument('align_sweep')
+def align_sweep(data, thresholds, workers=None, chunk_columns=256):
+    """Align ``data`` at every threshold in one pass.
+
+    The columns are processed in blocks of ``chunk_columns`` to keep the
+    temporaries cache-sized; with ``workers`` the blocks run on a thread
+    pool, which pays off for very wide inputs on multi-core machines.
+    """
+    values = data.to_numpy(dtype='float64', na_value=np.nan)
+    thresholds = np.asarray(thresholds, dtype='float64')
+    out = np.empty((len(thresholds),) + values.shape)
+
+    blocks = [slice(start, start + chunk_columns)
+              for start in range(0, values.shape[1], chunk_columns)]
+    if workers and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda b: _sweep_block(values[:, b], thresholds, out[:, :, b]), blocks))
+    else:
+        for b in blocks:
+            _sweep_block(values[:, b], thresholds, out[:, :, b])
+    return AlignedSweep(out, thresholds, data.columns)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from covid19_eda.chunked import group_us_chunked
+from covid19_eda.snapshot import read_index
+
+
+def _us_frame(n_rows=300, n_days=40, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2020-01-22', periods=n_days, freq='D')
+    frame = pd.DataFrame({
+        'UID': np.arange(n_rows), 'iso2': 'US', 'iso3': 'USA', 'code3': 840,
+        'FIPS': np.arange(n_rows), 'Admin2': ['County %d' % i for i in range(n_rows)],
+        'Province_State': rng.choice(['State %d' % i for i in range(12)] + [None], n_rows),
+        'Country_Region': 'US', 'Lat': 1.0, 'Long_': 2.0,
+        'Combined_Key': ['County %d, US' % i for i in range(n_rows)],
+        'Population': 1000,
+    })
+    counts = np.cumsum(rng.integers(0, 20, (n_rows, n_days)), axis=1)
+    date_columns = ['%d/%d/%s' % (d.month, d.day, d.strftime('%y')) for d in dates]
+    return pd.concat([frame, pd.DataFrame(counts, columns=date_columns)], axis=1)
+
+
+@pytest.mark.parametrize('key', ['Province_State', 'Combined_Key'])
+def test_matches_groupby_sum(tmp_path, key):
+    raw = _us_frame()
+    path = tmp_path / 'us.csv'
+    raw.to_csv(path, index=False)
+
+    grouped = group_us_chunked(str(path), str(tmp_path / 'out'), 'deaths', key=key, chunk_rows=37)
+
+    date_columns = list(raw.columns[12:])
+    expected = raw.fillna({key: ''}).groupby(key)[date_columns].sum().T
+    np.testing.assert_array_equal(grouped.to_numpy(), expected.to_numpy())
+    assert list(grouped.columns) == list(expected.columns)
+    assert grouped.columns.name == key
+    assert list(grouped.index) == list(pd.to_datetime(date_columns, format='%m/%d/%y'))
+
+
+def test_each_metric_keeps_its_source_hash(tmp_path):
+    for seed, name in enumerate(['confirmed', 'deaths']):
+        _us_frame(seed=seed).to_csv(tmp_path / (name + '.csv'), index=False)
+        group_us_chunked(str(tmp_path / (name + '.csv')), str(tmp_path / 'out'), name)
+
+    metrics = read_index(str(tmp_path / 'out'))['metrics']
+    assert set(metrics) == {'confirmed', 'deaths'}
+    assert metrics['confirmed']['source_hash'] != metrics['deaths']['source_hash']
@@ -0,0 +1,64 @@
+import pytest
+
+from covid19_eda.daily_reports import RetryableStatus, load_daily_reports
+
+REPORTS = {
+    # Early header layout
+    '/03-01-2020.csv': ('Province/State,Country/Region,Last Update,Confirmed,Deaths,Recovered\n'
+                        'Hubei,Mainland China,2020-03-01T10:13:19,66907,2761,31536\n'
+                        'Beijing,Mainland China,2020-03-01T10:13:19,413,8,276\n'
+                        ',Italy,2020-03-01T23:23:02,1694,34,83\n'),
+    # Later layout with underscores and extra columns
+    '/03-02-2020.csv': ('\ufeffFIPS,Admin2,Province_State,Country_Region,Last_Update,Lat,Long_,'
+                        'Confirmed,Deaths,Recovered,Active,Combined_Key\n'
+                        ',,Hubei,China,2020-03-02 15:03:23,30.97,112.27,67103,2803,33934,30366,"Hubei, China"\n'
+                        ',,,Italy,2020-03-02 20:23:16,41.87,12.56,2036,52,149,1835,Italy\n'
+                        ',,,France,2020-03-02 20:23:16,46.22,2.21,191,3,12,176,France\n'),
+    # Served after one 503
+    '/03-04-2020.csv': ('Province/State,Country/Region,Last Update,Confirmed,Deaths,Recovered\n'
+                        'Hubei,Mainland China,2020-03-04T12:53:03,67466,2902,36208\n'
+                        ',Italy,2020-03-04T12:53:03,3089,107,276\n'),
+}
+
+
+def _respond(handler):
+    body = REPORTS.get(handler.path)
+    if body is None:
+        return 404, {}, b''
+    if handler.path == '/03-04-2020.csv' and _paths(handler.server).count(handler.path) == 1:
+        return 503, {}, b''
+    return 200, {}, body.encode()
+
+
+def _paths(server):
+    return [path for path, _ in server.requests]
+
+
+def test_reports_are_summed_over_both_layouts(stub_server):
+    server = stub_server(_respond)
+    frames, missing = load_daily_reports('2020-03-01', '2020-03-04', base_url=server.url,
+                                         retries=2, backoff=0, timeout=5)
+
+    # The missing day is reported, not fatal, and stays in the frames
+    assert [d.strftime('%Y-%m-%d') for d in missing] == ['2020-03-03']
+    # The 503 was retried once
+    assert _paths(server).count('/03-04-2020.csv') == 2
+
+    for frame in frames.values():
+        assert [d.strftime('%m-%d') for d in frame.index] == ['03-01', '03-02', '03-03', '03-04']
+        assert list(frame.columns) == ['China', 'France', 'Italy']
+        assert frame.columns.name == 'Country/Region'
+
+    confirmed = frames['confirmed']
+    assert confirmed['China'].tolist() == [66907 + 413, 67103, 67103, 67466]
+    assert confirmed['Italy'].tolist() == [1694, 2036, 2036, 3089]
+    # France is carried forward from its first report, not reset to 0
+    assert confirmed['France'].tolist() == [0, 191, 191, 191]
+    assert frames['deaths']['Italy'].tolist() == [34, 52, 52, 107]
+
+
+def test_retries_are_exhausted(stub_server):
+    server = stub_server(_respond)
+    with pytest.raises(RetryableStatus):
+        load_daily_reports('2020-03-04', '2020-03-04', base_url=server.url,
+                           retries=0, backoff=0, timeout=5)
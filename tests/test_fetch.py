@@ -0,0 +1,34 @@
+import pytest
+
+from covid19_eda.fetch import fetch, read_csv_cached
+
+BODY = b'a,b\n1,2\n'
+
+
+def _respond(handler):
+    if handler.headers.get('If-None-Match') == '"v1"':
+        return 304, {}, b''
+    return 200, {'ETag': '"v1"'}, BODY
+
+
+def test_downloaded_then_not_modified_then_offline(stub_server, tmp_path):
+    server = stub_server(_respond)
+    url = server.url + 'data.csv'
+
+    path, status = fetch(url, cache_dir=str(tmp_path))
+    assert status == 'downloaded'
+    with open(path, 'rb') as f:
+        assert f.read() == BODY
+
+    assert fetch(url, cache_dir=str(tmp_path)) == (path, 'not-modified')
+    assert [headers.get('If-None-Match') for _, headers in server.requests] == [None, '"v1"']
+
+    server.shutdown()
+    server.server_close()
+    assert fetch(url, cache_dir=str(tmp_path), timeout=1) == (path, 'offline')
+    assert read_csv_cached(url, cache_dir=str(tmp_path), timeout=1).to_dict('list') == {'a': [1], 'b': [2]}
+
+
+def test_offline_without_cache_raises(tmp_path):
+    with pytest.raises(OSError):
+        fetch('http://127.0.0.1:9/missing.csv', cache_dir=str(tmp_path), timeout=1)
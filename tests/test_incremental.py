@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import jhu_wide_frame
+from covid19_eda.compact import compact_counts
+from covid19_eda.incremental import append_aligned, append_new_dates, first_crossings, refresh
+from covid19_eda.loader import read_jhu_csv
+from covid19_eda.processing import align_curves, group_by_country
+from covid19_eda.snapshot import load_snapshot
+
+
+@pytest.fixture
+def raw():
+    return jhu_wide_frame(n_countries=20, n_provinces=2, n_days=60)
+
+
+def _refresh(raw, tmp_path):
+    path = tmp_path / 'confirmed.csv'
+    raw.to_csv(path, index=False)
+    return refresh({'confirmed': path.as_uri()}, str(tmp_path / 'snapshot'),
+                   cache_dir=str(tmp_path / 'cache'))
+
+
+def _expected(raw, tmp_path):
+    path = tmp_path / 'expected.csv'
+    raw.to_csv(path, index=False)
+    return group_by_country(read_jhu_csv(path))
+
+
+def test_refresh_appends_new_dates(raw, tmp_path):
+    _refresh(raw.iloc[:, :4 + 50], tmp_path)
+    frames, added = _refresh(raw, tmp_path)
+    assert added == {'confirmed': 10}
+    pd.testing.assert_frame_equal(frames['confirmed'], _expected(raw, tmp_path),
+                                  check_freq=False, check_dtype=False)
+
+
+def test_refresh_without_new_dates(raw, tmp_path):
+    first, _ = _refresh(raw, tmp_path)
+    frames, added = _refresh(raw, tmp_path)
+    assert added == {'confirmed': 0}
+    pd.testing.assert_frame_equal(frames['confirmed'], first['confirmed'])
+
+
+def test_refresh_regroups_revised_values(raw, tmp_path):
+    _refresh(raw, tmp_path)
+    revised = raw.copy()
+    revised.iloc[:, 10] += 1000
+    frames, added = _refresh(revised, tmp_path)
+    assert added == {'confirmed': 0}
+    expected = _expected(revised, tmp_path)
+    pd.testing.assert_frame_equal(frames['confirmed'], expected, check_freq=False, check_dtype=False)
+
+    # The rewritten snapshot is complete and reflects the revision
+    frames, _ = _refresh(revised, tmp_path)
+    pd.testing.assert_frame_equal(frames['confirmed'], expected, check_freq=False, check_dtype=False)
+
+
+def test_append_aligned_matches_full_alignment(raw):
+    grouped = group_by_country(raw)
+    for min_val in (1, 25, 500):
+        aligned = align_curves(grouped.iloc[:40], min_val)
+        first = first_crossings(grouped.iloc[:40], min_val)
+        aligned, first = append_aligned(aligned, first, grouped, 40, min_val)
+        pd.testing.assert_frame_equal(aligned, align_curves(grouped, min_val))
+        pd.testing.assert_series_equal(first, first_crossings(grouped, min_val))
+
+
+def test_snapshot_of_csv_with_gaps_loads_back(raw, tmp_path):
+    raw = raw.astype({raw.columns[10]: 'float64'})
+    raw.iloc[0, 10] = None
+    frames, _ = _refresh(raw, tmp_path)
+    assert str(frames['confirmed'].dtypes.iloc[0]) == 'Int32'
+
+    stored = load_snapshot(str(tmp_path / 'snapshot'))
+    assert stored is not None
+    pd.testing.assert_frame_equal(stored['confirmed'], frames['confirmed'],
+                                  check_freq=False, check_dtype=False)
+
+
+def test_append_widens_compacted_counts(raw):
+    raw = raw.copy()
+    grouped = compact_counts(group_by_country(raw.iloc[:, :4 + 50]))
+    raw[raw.columns[-1]] = 70000
+    frame, added = append_new_dates(raw, grouped)
+
+    assert added == 10
+    assert frame.iloc[-1].min() >= 70000
+    pd.testing.assert_frame_equal(frame, group_by_country(raw), check_freq=False, check_dtype=False)
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+from covid19_eda.compact import compact_counts
+from covid19_eda.metrics import daily_new, frame_hash, get_metric
+from covid19_eda.processing import align_curves
+
+
+def _counts():
+    return pd.DataFrame(np.cumsum(np.ones((30, 5), dtype='int64'), axis=0),
+                        index=pd.date_range('2020-03-01', periods=30))
+
+
+def test_frame_hash_uses_values_of_nullable_frames():
+    aligned = align_curves(_counts(), 10, compact=True)
+    assert frame_hash(aligned) == frame_hash(aligned.copy())
+    assert get_metric('daily_new', aligned) is get_metric('daily_new', aligned.copy())
+
+    changed = aligned.copy()
+    changed.iloc[3, 1] = 99
+    assert frame_hash(changed) != frame_hash(aligned)
+
+
+def test_daily_new_does_not_wrap_unsigned_counts():
+    counts = _counts()
+    counts.iloc[5, 0] = 0
+    compact = compact_counts(counts)
+    assert compact.dtypes.iloc[0].kind == 'u'
+    assert daily_new(compact).iloc[5, 0] == -5
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+
+from covid19_eda.quality import check_quality, repair
+
+
+def test_redistribute_spreads_drop_over_preceding_increments():
+    values = np.array([[100, 200, 300, 5, 310, 320],
+                       [0, 0, 10, 20, 15, 30]], dtype='float64').T
+    repaired = repair(values, 'redistribute')
+
+    np.testing.assert_allclose(repaired[:, 0], [5 / 3, 10 / 3, 5, 5, 310, 320])
+    np.testing.assert_allclose(repaired[:, 1], [0, 0, 10, 15, 15, 30])
+
+
+def test_redistribute_is_monotonic_and_keeps_trusted_values():
+    values = np.cumsum(np.random.default_rng(0).integers(-5, 20, (200, 30)), axis=0).astype('float64')
+    repaired = repair(values, 'redistribute')
+
+    assert (np.diff(repaired, axis=0) >= -1e-9).all()
+    trusted = values == np.minimum.accumulate(values[::-1], axis=0)[::-1]
+    np.testing.assert_allclose(repaired[trusted], values[trusted])
+
+
+def test_check_quality_repairs_drops_and_only_reports_spikes():
+    frame = pd.DataFrame({'A': [100, 200, 300, 5, 310, 320],
+                          'B': [0, 1, 2, 3, 1000, 1001]},
+                         index=pd.date_range('2020-03-01', periods=6))
+    result = check_quality(frame, policy='redistribute', stale_days=10)
+
+    assert result.repaired['A'].tolist() == [2, 3, 5, 5, 310, 320]
+    assert result.repaired['B'].tolist() == frame['B'].tolist()
+    assert result.flags['non_monotonic'][:, 0].tolist() == [False, False, False, True, False, False]
+    assert result.report.loc['B', 'spikes'] == 1
+
+
+def test_gaps_are_carried_forward_not_zeroed():
+    frame = pd.DataFrame({'A': [100, 200, np.nan, 300], 'B': [np.nan, 5, 7, 9]},
+                         index=pd.date_range('2020-03-01', periods=4))
+    result = check_quality(frame, policy='redistribute', stale_days=10)
+
+    assert result.repaired['A'].tolist() == [100, 200, 200, 300]
+    assert result.repaired['B'].tolist() == [0, 5, 7, 9]
+    assert not result.flags['non_monotonic'].any()
@@ -0,0 +1,23 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from covid19_eda.report import ReportChart, build_report
+
+
+@pytest.mark.parametrize('columns_name', [None, 'Province_State', 'Country/Region'])
+def test_altair_chart_uses_the_frame_column_name(tmp_path, columns_name):
+    aligned = pd.DataFrame(np.cumsum(np.ones((20, 3)), axis=0) * 10,
+                           columns=pd.Index(['A', 'B', 'C'], name=columns_name))
+    chart = ReportChart('deaths', 'Deaths', 'altair', aligned, {'value': 'Deaths', 'max_points': None})
+
+    path, stats = build_report([chart], str(tmp_path))
+
+    assert stats['charts'] == 1
+    artifacts = os.listdir(tmp_path / 'artifacts')
+    with open(tmp_path / 'artifacts' / artifacts[0]) as f:
+        spec = json.load(f)
+    assert (columns_name or 'variable') in json.dumps(spec['layer'][0]['encoding'])
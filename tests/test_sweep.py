@@ -0,0 +1,17 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import jhu_wide_frame
+from covid19_eda.processing import align_curves, group_by_country
+from covid19_eda.sweep import align_sweep
+
+THRESHOLDS = [1, 25, 100, 300]
+
+
+@pytest.mark.parametrize('workers', [None, 4])
+def test_slices_match_align_curves(workers):
+    data = group_by_country(jhu_wide_frame(n_countries=40, n_provinces=2, n_days=90))
+    sweep = align_sweep(data, THRESHOLDS, workers=workers, chunk_columns=7)
+
+    for threshold in THRESHOLDS:
+        pd.testing.assert_frame_equal(sweep.frame(threshold), align_curves(data, threshold))